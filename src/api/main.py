@@ -2,6 +2,7 @@
 Main entry point for SD-Host API application
 """
 
+import logging
 import sys
 import os
 from contextlib import asynccontextmanager
@@ -11,46 +12,56 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 
-from core.database import db_manager
+from core.database import get_db_manager
 from core.config import get_settings
 from api.models import router as models_router
 
+logger = logging.getLogger("sdhost.lifespan")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     # Startup
-    print("Starting SD-Host application...")
-    
+    logger.info("Starting SD-Host application...")
+
     # Create database tables
+    db_manager = get_db_manager()
     await db_manager.create_tables()
-    print("Database tables created/verified")
-    
+    logger.info("Database tables created/verified")
+
     # Initialize download task recovery
     try:
         from services.civitai_service import CivitaiService
-        
+
         async with db_manager.get_session() as session:
             civitai_service = CivitaiService(session)
             await civitai_service.initialize_from_database()
             await civitai_service.resume_existing_downloads()
-            print("Download task recovery completed")
+            logger.info("Download task recovery completed")
     except Exception as e:
-        print(f"Error during download task recovery: {e}")
-    
+        logger.error("Error during download task recovery: %s", e)
+
     yield
-    
+
     # Shutdown
-    print("Shutting down SD-Host application...")
+    logger.info("Shutting down SD-Host application...")
     await db_manager.close()
 
 
 def create_app() -> FastAPI:
     """Create FastAPI application"""
     settings = get_settings()
-    
+
+    # Configure once; no-op if the embedding process already did
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
     app = FastAPI(
         title=settings.app_name,
         description="Stable Diffusion RESTful API Service",
@@ -67,6 +78,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress large JSON responses (model lists compress ~10x)
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Include routers
     app.include_router(models_router)
     
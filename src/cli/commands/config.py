@@ -7,10 +7,10 @@ from typing import Optional
 import json
 
 import typer
-from rich.table import Table
 
+# rich.table and core.config are imported inside the commands so that
+# registering this sub-app stays cheap for unrelated invocations
 from ..utils import console, success, error, warning, info, header, format_boolean, format_optional, CLIState
-from core.config import get_config_file_path, save_config, reload_settings
 
 app = typer.Typer(help="Configuration management commands")
 
@@ -19,10 +19,14 @@ def show(
     ctx: typer.Context,
 ):
     """Show all configuration values in key-value format"""
+    from rich.table import Table
+
+    from core.config import get_config_file_path
+
     cli_state = ctx.obj
-    
+
     header("SD-Host Configuration")
-    
+
     # Configuration file info
     config_path = get_config_file_path()
     config_status = "exists" if config_path.exists() else "using defaults"
@@ -162,6 +166,8 @@ def set(
     ctx: typer.Context = None
 ):
     """Set a configuration value"""
+    from core.config import save_config
+
     if ctx is None:
         ctx = typer.Context(set)
     cli_state = ctx.obj
@@ -196,6 +202,8 @@ def set(
 @app.command()
 def path():
     """Show configuration file path"""
+    from core.config import get_config_file_path
+
     config_path = get_config_file_path()
     console.print(f"Configuration file: [cyan]{config_path}[/cyan]")
     if config_path.exists():
@@ -209,6 +217,8 @@ def init(
     force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing configuration")
 ):
     """Initialize configuration file"""
+    from core.config import get_config_file_path, save_config
+
     cli_state = ctx.obj
     config_path = get_config_file_path()
     
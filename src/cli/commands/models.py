@@ -3,21 +3,174 @@ Models management commands
 """
 
 import re
-from typing import Optional, Dict, Any
-import asyncio
 import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse, parse_qs
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json works everywhere
+    import json as _json
 
 import typer
-import requests
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
-from rich.live import Live
-from rich.panel import Panel
+
+# rich renderables are imported inside the commands that draw tables so
+# registering this sub-app stays cheap for unrelated invocations
 
 from ..utils import console, success, error, warning, info, header, format_bytes, CLIState
 
 app = typer.Typer(help="Models management commands")
 
+
+# Shared HTTP session (created on first use) so repeated API calls in one
+# process reuse a keep-alive connection to the local service
+_session = None
+
+# Persistent event loop shared by all async helpers; asyncio.run would
+# pay loop/selector setup on every tracking or gather call
+_loop = None
+
+
+def _get_loop():
+    """Get the shared event loop, creating it on first use"""
+    global _loop
+    if _loop is None:
+        import asyncio
+        import atexit
+
+        _loop = asyncio.new_event_loop()
+        atexit.register(_loop.close)
+    return _loop
+
+
+def _get_session():
+    """Get the shared requests.Session, creating it on first use"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Retry transient failures with backoff instead of hard-erroring
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET", "POST", "DELETE"],
+        )
+        _session = requests.Session()
+        _session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                              max_retries=retries))
+    return _session
+
+
+def _async_client(**kwargs):
+    """Build an httpx.AsyncClient preferring HTTP/2, degrading to HTTP/1.1
+
+    HTTP/2 lets concurrent SSE streams share one TCP connection; when the
+    optional h2 package is missing we fall back to keep-alive HTTP/1.1.
+    """
+    import httpx
+
+    try:
+        return httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        return httpx.AsyncClient(**kwargs)
+
+
+# On-disk response cache for the slow-changing catalog endpoints
+_CACHE_MAX_AGE = 60.0  # Seconds a cached payload stays fresh
+_CACHEABLE_ENDPOINTS = ("/api/models", "/api/models/download-tasks")
+
+
+def _cache_file(api_base: str, endpoint: str) -> Path:
+    """Cache file path for an endpoint under ~/.cache/sdh.
+
+    The target host:port is folded into the filename so CLIs pointed at
+    different instances never serve each other's payloads.
+    """
+    target = api_base.split("://", 1)[-1].replace(":", "_")
+    return Path.home() / ".cache" / "sdh" / (
+        target + "_" + endpoint.strip("/").replace("/", "_") + ".json")
+
+
+def _cache_load(api_base: str, endpoint: str) -> Optional[Dict[str, Any]]:
+    """Return the cached payload for an endpoint if it is still fresh"""
+    import json
+
+    try:
+        entry = json.loads(_cache_file(api_base, endpoint).read_text(encoding="utf-8"))
+        if time.time() - entry["ts"] <= _CACHE_MAX_AGE:
+            return entry["data"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _cache_store(api_base: str, endpoint: str, data: Dict[str, Any]):
+    """Persist an endpoint payload with its fetch timestamp"""
+    import json
+
+    try:
+        path = _cache_file(api_base, endpoint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"ts": time.time(), "data": data}), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _cache_invalidate(api_base: str):
+    """Drop cached catalog payloads after any mutating request"""
+    for endpoint in _CACHEABLE_ENDPOINTS:
+        try:
+            _cache_file(api_base, endpoint).unlink()
+        except OSError:
+            pass
+
+
+# Pattern for CivitAI URLs: https://civitai.com/models/{model_id}/{name}
+_CIVITAI_URL_RE = re.compile(r'^https?://civitai\.com/models/(\d+)(?:/[^?]*)?')
+
+# Defaults used when a model payload carries no attributes
+_EMPTY_ATTRS = {"status": "unknown", "model_type": "unknown", "size": 0}
+
+# Precomputed Rich markup per status, so per-row rendering is one dict get
+_MODEL_STATUS_STYLE = {
+    "ready": "[green]ready[/green]",
+    "downloading": "[yellow]downloading[/yellow]",
+    "error": "[red]error[/red]",
+}
+_TASK_STATUS_STYLE = {
+    "downloading": "[green]downloading[/green]",
+    "paused": "[yellow]paused[/yellow]",
+    "completed": "[blue]completed[/blue]",
+    "failed": "[red]failed[/red]",
+    "cancelled": "[dim]cancelled[/dim]",
+}
+_COUNT_TEMPLATES = {
+    "ready": "[green]{}[/green]",
+    "downloading": "[yellow]{}[/yellow]",
+    "error": "[red]{}[/red]",
+}
+
+
+def _short_hash(full_hash: str) -> str:
+    """Truncate a hash to 16 characters for display (single allocation)"""
+    return f"{full_hash:.16}..."
+
+
+def _print_json(payload) -> None:
+    """Write a payload to stdout as plain JSON, bypassing Rich entirely"""
+    import sys
+
+    raw = _json.dumps(payload)
+    if isinstance(raw, bytes):  # orjson returns bytes, stdlib json returns str
+        raw = raw.decode()
+    sys.stdout.write(raw + "\n")
+
+
 @app.command()
 def list(
     ctx: typer.Context,
@@ -25,14 +178,21 @@ def list(
     model_type: Optional[str] = typer.Option(None, "--type", "-t", help="Filter by model type"),
     include_tags: Optional[str] = typer.Option(None, "--include-tags", "--tags", "-i", help="Include models with these tags (comma-separated, AND relationship)"),
     exclude_tags: Optional[str] = typer.Option(None, "--exclude-tags", "-e", help="Exclude models with these tags (comma-separated, OR relationship)"),
+    refresh: bool = typer.Option(False, "--refresh", "--no-cache", help="Bypass the local response cache"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format: table or json"),
 ):
     """List all available models"""
+    from rich.console import Group
+    from rich.table import Table
+    from rich.text import Text
+
     cli_state = ctx.obj
-    
-    header("Models List")
-    
+
+    if output == "table":
+        header("Models List")
+
     # Show filter information if any filters are applied
-    if include_tags or exclude_tags or model_type:
+    if output == "table" and (include_tags or exclude_tags or model_type):
         filter_info = "🔍 Active filters: "
         filters = []
         if include_tags:
@@ -64,25 +224,33 @@ def list(
             params["excludeTags"].append(tag)
     
     # Make API request with parameters
-    data = _api_request(cli_state, "/api/models", params=params)
+    data = _api_request(cli_state, "/api/models", params=params, refresh=refresh)
     if not data:
         return
-    
-    models = data.get("data", [])
-    
-    if not models:
+
+    # Machine consumers get the raw payload, skipping table construction
+    if output == "json":
+        _print_json(data)
+        return
+
+    all_models = data.get("data", [])
+    total_count = len(all_models)
+
+    if not all_models:
         info("📭 No models found")
         return
-    
+
     # Filter by type if specified
     if model_type:
-        models = [m for m in models if m.get("attributes", {}).get("model_type") == model_type]
-    
+        models = [m for m in all_models if m.get("attributes", {}).get("model_type") == model_type]
+    else:
+        models = all_models
+
     # Limit results
     models = models[:limit]
-    
+
     # Create models table
-    table = Table(title=f"Models ({len(models)} of {len(data.get('data', []))})", 
+    table = Table(title=f"Models ({len(models)} of {total_count})",
                   show_header=True, header_style="bold cyan")
     table.add_column("Name", style="white", width=25)
     table.add_column("Type", style="blue", width=10)
@@ -97,7 +265,7 @@ def list(
         model_type_val = attrs.get("model_type", "unknown")
         size = attrs.get("size", 0)
         status = attrs.get("status", "unknown")
-        model_hash = model.get("id", "")[:16] + "..."
+        model_hash = _short_hash(model.get("id") or "")
         
         # Extract tags from relationships
         tags = []
@@ -116,15 +284,8 @@ def list(
             tags_str = "-"
         
         # Format status with color
-        if status == "ready":
-            status_fmt = "[green]ready[/green]"
-        elif status == "downloading":
-            status_fmt = "[yellow]downloading[/yellow]"
-        elif status == "error":
-            status_fmt = "[red]error[/red]"
-        else:
-            status_fmt = status
-        
+        status_fmt = _MODEL_STATUS_STYLE.get(status, status)
+
         table.add_row(
             name,
             model_type_val,
@@ -134,25 +295,39 @@ def list(
             model_hash
         )
     
-    console.print(table)
-    console.print()
-    
-    if len(data.get("data", [])) > limit:
-        info(f"Showing {limit} of {len(data.get('data', []))} models. Use --limit to show more.")
+    # Render the table, trailing newline and any hint in one flush
+    renderables = [table, ""]
+    if total_count > limit:
+        renderables.append(Text(
+            f"ℹ️  Showing {limit} of {total_count} models. Use --limit to show more.",
+            style="blue"))
+    console.print(Group(*renderables))
 
 @app.command()
 def status(
     ctx: typer.Context,
+    refresh: bool = typer.Option(False, "--refresh", "--no-cache", help="Bypass the local response cache"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format: table or json"),
 ):
     """Show models status overview"""
+    from rich.console import Group
+    from rich.table import Table
+
     cli_state = ctx.obj
-    
-    header("Models Status Overview")
-    
-    data = _api_request(cli_state, "/api/models")
-    if not data:
+
+    if output == "table":
+        header("Models Status Overview")
+
+    # Fetch the catalog and the download queue concurrently
+    results = _api_get_many(cli_state, ["/api/models", "/api/models/download-tasks"], refresh=refresh)
+    if not results or not results[0]:
         return
-    
+    data, tasks_data = results
+
+    if output == "json":
+        _print_json({"models": data, "download_tasks": tasks_data})
+        return
+
     models = data.get("data", [])
     total = len(models)
     
@@ -160,20 +335,11 @@ def status(
         info("📭 No models found")
         return
     
-    # Count by status
-    status_counts = {}
-    type_counts = {}
-    total_size = 0
-    
-    for model in models:
-        attrs = model.get("attributes", {})
-        status = attrs.get("status", "unknown")
-        model_type = attrs.get("model_type", "unknown")
-        size = attrs.get("size", 0)
-        
-        status_counts[status] = status_counts.get(status, 0) + 1
-        type_counts[model_type] = type_counts.get(model_type, 0) + 1
-        total_size += size
+    # Count by status (Counter increments at C level, one pass per metric)
+    all_attrs = [model.get("attributes") or _EMPTY_ATTRS for model in models]
+    status_counts = Counter(attrs.get("status", "unknown") for attrs in all_attrs)
+    type_counts = Counter(attrs.get("model_type", "unknown") for attrs in all_attrs)
+    total_size = sum(attrs.get("size", 0) for attrs in all_attrs)
     
     # Create overview table
     table = Table(title="Models Overview", show_header=True, header_style="bold cyan")
@@ -182,50 +348,75 @@ def status(
     
     table.add_row("Total Models", str(total))
     table.add_row("Total Size", format_bytes(total_size))
+
+    download_tasks = (tasks_data or {}).get("data", [])
+    active_downloads = sum(1 for t in download_tasks if t.get("status") == "downloading")
+    table.add_row("Active Downloads", str(active_downloads))
+
     table.add_row("", "")  # Separator
     
     # Add status breakdown
     for status, count in status_counts.items():
-        if status == "ready":
-            status_fmt = f"[green]{count}[/green]"
-        elif status == "downloading":
-            status_fmt = f"[yellow]{count}[/yellow]"
-        elif status == "error":
-            status_fmt = f"[red]{count}[/red]"
-        else:
-            status_fmt = str(count)
-        table.add_row(f"Status: {status}", status_fmt)
+        table.add_row(f"Status: {status}",
+                      _COUNT_TEMPLATES.get(status, "{}").format(count))
     
     table.add_row("", "")  # Separator
     
     # Add type breakdown
     for model_type, count in type_counts.items():
         table.add_row(f"Type: {model_type}", str(count))
-    
-    console.print(table)
-    console.print()
+
+    # Single flush for table plus trailing newline
+    console.print(Group(table, ""))
 
 @app.command()
-def download(
-    url: str = typer.Argument(..., help="Civitai model URL"),
-    ctx: typer.Context = None
+def overview(
+    ctx: typer.Context,
+    refresh: bool = typer.Option(False, "--refresh", "--no-cache", help="Bypass the local response cache"),
 ):
+    """Show a combined models and download-tasks dashboard"""
+    from rich.console import Group
+    from rich.table import Table
+
+    cli_state = ctx.obj
+
+    header("Models Dashboard")
+
+    # One concurrent round-trip for all dashboard payloads
+    results = _api_get_many(cli_state, ["/api/models", "/api/models/download-tasks"], refresh=refresh)
+    if not results:
+        return
+    models_data, tasks_data = results
+
+    models = (models_data or {}).get("data", [])
+    tasks = (tasks_data or {}).get("data", [])
+
+    table = Table(title="Overview", show_header=True, header_style="bold cyan")
+    table.add_column("Metric", style="cyan", width=20)
+    table.add_column("Value", style="white")
+
+    total_size = sum((m.get("attributes") or {}).get("size", 0) for m in models)
+    table.add_row("Total Models", str(len(models)))
+    table.add_row("Total Size", format_bytes(total_size))
+    table.add_row("Download Tasks", str(len(tasks)))
+    table.add_row("Active Downloads",
+                  str(sum(1 for t in tasks if t.get("status") == "downloading")))
+
+    console.print(Group(table, ""))
+
+@app.command(hidden=True)
+def download(url: str):
     """Download a model from Civitai (coming soon)"""
-    if ctx is None:
-        ctx = typer.Context(download)
     warning("🚧 Model download feature coming soon...")
     info(f"URL: {url}")
 
-@app.command() 
+@app.command()
 def remove(
+    ctx: typer.Context,
     model_hash: str = typer.Argument(..., help="Model hash or hash prefix to remove"),
-    ctx: typer.Context = None,
     force: bool = typer.Option(False, "--force", "-f", help="Force removal without confirmation")
 ):
     """Remove a model by hash or hash prefix"""
-    if ctx is None:
-        ctx = typer.Context(remove)
-    
     cli_state = ctx.obj
     
     header("Remove Model")
@@ -252,7 +443,7 @@ def remove(
         error(f"❌ Ambiguous hash prefix '{model_hash}'. Found {len(matching_models)} matching models:")
         for model in matching_models:
             attrs = model.get("attributes", {})
-            console.print(f"  • {attrs.get('name', 'Unknown')} - {model.get('id', '')[:16]}...")
+            console.print(f"  • {attrs.get('name', 'Unknown')} - {_short_hash(model.get('id') or '')}")
         info("💡 Please provide a more specific hash prefix")
         return
     
@@ -289,19 +480,32 @@ def remove(
     else:
         error("❌ Failed to communicate with service")
 
-def _api_request(cli_state: CLIState, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+def _api_request(cli_state: CLIState, endpoint: str, params: Dict[str, Any] = None,
+                 refresh: bool = False) -> Optional[Dict[str, Any]]:
     """Make API request to SD-Host service"""
+    import requests
+
     from .service import _is_service_running
-    
+
+    cacheable = not params and endpoint in _CACHEABLE_ENDPOINTS
+    if cacheable and not refresh:
+        cached = _cache_load(cli_state.api_base, endpoint)
+        if cached is not None:
+            return cached
+
     if not _is_service_running(cli_state):
         error("Service is not running")
         info("Start the service with: sdh service start")
         return None
-    
+
     try:
-        response = requests.get(f"{cli_state.api_base}{endpoint}", params=params, timeout=10)
+        response = _get_session().get(f"{cli_state.api_base}{endpoint}", params=params,
+                                      headers={"Accept-Encoding": "gzip"}, timeout=(2, 10))
         if response.status_code == 200:
-            return response.json()
+            data = response.json()
+            if cacheable:
+                _cache_store(cli_state.api_base, endpoint, data)
+            return data
         else:
             error(f"API request failed: {response.status_code}")
             return None
@@ -310,24 +514,76 @@ def _api_request(cli_state: CLIState, endpoint: str, params: Dict[str, Any] = No
         return None
 
 
+def _api_get_many(cli_state: CLIState, endpoints, refresh: bool = False) -> Optional[list]:
+    """Fetch several API endpoints concurrently, one JSON payload per endpoint"""
+    import asyncio
+
+    from .service import _is_service_running
+
+    if not refresh:
+        cached = [_cache_load(cli_state.api_base, endpoint)
+                  if endpoint in _CACHEABLE_ENDPOINTS else None
+                  for endpoint in endpoints]
+        if all(entry is not None for entry in cached):
+            return cached
+
+    if not _is_service_running(cli_state):
+        error("Service is not running")
+        info("Start the service with: sdh service start")
+        return None
+
+    try:
+        import httpx
+    except ImportError:
+        # Fall back to sequential fetches over the shared session
+        return [_api_request(cli_state, endpoint, refresh=refresh) for endpoint in endpoints]
+
+    async def _fetch_all():
+        async with httpx.AsyncClient(base_url=cli_state.api_base, timeout=10) as client:
+            responses = await asyncio.gather(
+                *[client.get(endpoint, headers={"Accept-Encoding": "gzip"}) for endpoint in endpoints],
+                return_exceptions=True,
+            )
+            results = []
+            for endpoint, response in zip(endpoints, responses):
+                if isinstance(response, Exception):
+                    error(f"Connection error for {endpoint}: {response}")
+                    results.append(None)
+                elif response.status_code != 200:
+                    error(f"API request failed: {response.status_code} ({endpoint})")
+                    results.append(None)
+                else:
+                    data = response.json()
+                    if endpoint in _CACHEABLE_ENDPOINTS:
+                        _cache_store(cli_state.api_base, endpoint, data)
+                    results.append(data)
+            return results
+
+    try:
+        return _get_loop().run_until_complete(_fetch_all())
+    except Exception as e:
+        error(f"Connection error: {e}")
+        return None
+
+
 def _parse_civitai_url(url: str) -> Optional[Dict[str, str]]:
     """Parse CivitAI URL to extract model ID and version ID"""
-    # Pattern for CivitAI URLs: https://civitai.com/models/{model_id}/{name}?modelVersionId={version_id}
-    pattern = r'https://civitai\.com/models/(\d+)(?:/[^?]*)?(?:\?.*modelVersionId=(\d+))?'
-    match = re.match(pattern, url)
-    
-    if match:
-        model_id = match.group(1)
-        version_id = match.group(2)
-        return {
-            "model_id": model_id,
-            "version_id": version_id
-        }
-    return None
+    match = _CIVITAI_URL_RE.match(url)
+    if not match:
+        return None
+
+    # Pull modelVersionId from the query string (linear-time, no backtracking)
+    version_values = parse_qs(urlparse(url).query).get("modelVersionId")
+    return {
+        "model_id": match.group(1),
+        "version_id": version_values[0] if version_values else None
+    }
 
 
 def _api_post_request(cli_state: CLIState, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Make a POST request to the API"""
+    import requests
+
     from .service import _is_service_running
     
     if not _is_service_running(cli_state):
@@ -336,8 +592,10 @@ def _api_post_request(cli_state: CLIState, endpoint: str, data: Dict[str, Any])
         return None
     
     try:
-        response = requests.post(f"{cli_state.api_base}{endpoint}", json=data, timeout=30)
+        # Fail fast on connect, allow slow reads for heavy backend work
+        response = _get_session().post(f"{cli_state.api_base}{endpoint}", json=data, timeout=(2, 30))
         if response.status_code in [200, 201, 202]:
+            _cache_invalidate(cli_state.api_base)
             return response.json()
         else:
             error(f"API request failed: {response.status_code}")
@@ -351,6 +609,8 @@ def _api_post_request(cli_state: CLIState, endpoint: str, data: Dict[str, Any])
 
 def _api_delete_request(cli_state: CLIState, endpoint: str) -> Optional[Dict[str, Any]]:
     """Make a DELETE request to the API"""
+    import requests
+
     from .service import _is_service_running
     
     if not _is_service_running(cli_state):
@@ -359,8 +619,9 @@ def _api_delete_request(cli_state: CLIState, endpoint: str) -> Optional[Dict[str
         return None
     
     try:
-        response = requests.delete(f"{cli_state.api_base}{endpoint}", timeout=30)
+        response = _get_session().delete(f"{cli_state.api_base}{endpoint}", timeout=(2, 30))
         if response.status_code in [200, 204]:
+            _cache_invalidate(cli_state.api_base)
             return response.json() if response.content else {"success": True}
         else:
             error(f"API request failed: {response.status_code}")
@@ -374,89 +635,128 @@ def _api_delete_request(cli_state: CLIState, endpoint: str) -> Optional[Dict[str
 
 def _track_download_progress(cli_state: CLIState, tracking_hash: str, show_details: bool = True):
     """Track download progress using SSE"""
+    import asyncio
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+
     try:
-        import sseclient
+        import httpx
     except ImportError:
-        error("sseclient-py is required for progress tracking")
-        info("Install with: pip install sseclient-py")
+        error("httpx is required for progress tracking")
+        info("Install with: pip install httpx")
         return False
-    
-    try:
-        url = f"{cli_state.api_base}/api/models/add-from-civitai/{tracking_hash}"
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            TimeRemainingColumn(),
-            console=console,
-            transient=False,
-        ) as progress:
-            
-            download_task = progress.add_task("Downloading model...", total=100)
-            
-            try:
-                response = requests.get(url, stream=True, timeout=10)
-                client = sseclient.SSEClient(response)
-                
-                for event in client.events():
-                    if event.data:
+
+    url = f"{cli_state.api_base}/api/models/add-from-civitai/{tracking_hash}"
+
+    async def _reader(client, queue: asyncio.Queue):
+        """Stream SSE 'data:' frames into the queue"""
+        try:
+            async with client.stream("GET", url) as response:
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
                         try:
-                            import json
-                            # Try to parse as JSON first
-                            parsed_data = json.loads(event.data)
-                            
-                            # Check if it's already a dictionary (direct JSON object)
-                            if isinstance(parsed_data, dict):
-                                data = parsed_data
-                            # If it's a string containing SSE format "data: {JSON}\n\n"
-                            elif isinstance(parsed_data, str) and parsed_data.startswith("data: "):
-                                json_part = parsed_data[6:].rstrip('\n')  # Remove "data: " prefix and trailing newlines
-                                data = json.loads(json_part)
-                            else:
-                                continue
-                            
-                            status = data.get("status", "unknown")
-                            
-                            if status == "downloading":
-                                progress_value = data.get("progress", 0)
-                                speed = data.get("speed", "0 B/s")
-                                eta = data.get("eta", "calculating...")
-                                
-                                progress.update(download_task, 
-                                              completed=progress_value,
-                                              description=f"Downloading... {speed} | ETA: {eta}")
-                                
-                            elif status == "completed":
-                                progress.update(download_task, completed=100)
-                                model_info = data.get("model_info")
-                                if model_info and show_details:
-                                    success(f"✅ Download completed!")
-                                    info(f"Model: {model_info.get('name', 'Unknown')}")
-                                    info(f"Hash: {model_info.get('hash', 'Unknown')}")
-                                    info(f"Size: {format_bytes(model_info.get('size', 0))}")
-                                else:
-                                    success("✅ Download completed!")
-                                return True
-                                
-                            elif status == "failed":
-                                error_msg = data.get("error", "Unknown error")
-                                error(f"❌ Download failed: {error_msg}")
-                                return False
-                                
-                        except json.JSONDecodeError:
-                            continue
-                            
-            except requests.exceptions.RequestException as e:
-                error(f"Failed to connect to progress stream: {e}")
+                            queue.put_nowait(line[5:].strip())
+                        except asyncio.QueueFull:
+                            pass  # Drop bursts the renderer cannot keep up with
+        except httpx.HTTPError as e:
+            error(f"Failed to connect to progress stream: {e}")
+        finally:
+            # Sentinel so the renderer stops when the stream ends. Never
+            # block here: if the renderer already exited and the queue is
+            # full, an awaited put would hang the cancelled reader forever
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+
+    async def _renderer(queue: asyncio.Queue, progress, download_task) -> bool:
+        """Drain queued events and update the progress bar"""
+        # Coalesce redraws: only repaint on >=1% change or >=100ms elapsed
+        last_pct = -1.0
+        last_ts = 0.0
+        while True:
+            try:
+                event_data = await asyncio.wait_for(queue.get(), timeout=0.1)
+            except asyncio.TimeoutError:
+                continue
+
+            if event_data is None:
                 return False
-                
+
+            try:
+                data = _json.loads(event_data)
+                if not isinstance(data, dict):
+                    continue
+
+                status = data.get("status", "unknown")
+
+                if status == "downloading":
+                    progress_value = data.get("progress", 0)
+                    now = time.monotonic()
+                    if abs(progress_value - last_pct) < 1.0 and now - last_ts < 0.1:
+                        continue
+                    last_pct = progress_value
+                    last_ts = now
+                    speed = data.get("speed", "0 B/s")
+                    eta = data.get("eta", "calculating...")
+
+                    progress.update(download_task,
+                                  completed=progress_value,
+                                  description=f"Downloading... {speed} | ETA: {eta}")
+
+                elif status == "completed":
+                    progress.update(download_task, completed=100)
+                    model_info = data.get("model_info")
+                    if model_info and show_details:
+                        success(f"✅ Download completed!")
+                        info(f"Model: {model_info.get('name', 'Unknown')}")
+                        info(f"Hash: {model_info.get('hash', 'Unknown')}")
+                        info(f"Size: {format_bytes(model_info.get('size', 0))}")
+                    else:
+                        success("✅ Download completed!")
+                    return True
+
+                elif status == "failed":
+                    error_msg = data.get("error", "Unknown error")
+                    error(f"❌ Download failed: {error_msg}")
+                    return False
+
+            except ValueError:  # Covers both orjson and stdlib JSONDecodeError
+                continue
+
+    async def _run() -> bool:
+        # Bounded queue keeps event bursts from stalling the renderer
+        queue = asyncio.Queue(maxsize=64)
+
+        # No read timeout: SSE streams stay quiet between events
+        async with _async_client(timeout=httpx.Timeout(10.0, read=None)) as client:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                transient=False,
+                refresh_per_second=10,
+            ) as progress:
+
+                download_task = progress.add_task("Downloading model...", total=100)
+                reader = asyncio.create_task(_reader(client, queue))
+
+                try:
+                    return await _renderer(queue, progress, download_task)
+                finally:
+                    reader.cancel()
+                    try:
+                        await reader
+                    except asyncio.CancelledError:
+                        pass
+
+    try:
+        return _get_loop().run_until_complete(_run())
     except Exception as e:
         error(f"Progress tracking failed: {e}")
         return False
-    
-    return False
 
 
 @app.command("add-from-civitai")
@@ -554,22 +854,121 @@ def add_from_civitai(
             info(f"You can resume tracking with: sdh models add-from-civitai --tracking {tracking_hash}")
 
 
+@app.command("track-all")
+def track_all_downloads(
+    ctx: typer.Context,
+):
+    """Track all active downloads over one shared connection"""
+    import asyncio
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+
+    cli_state = ctx.obj
+
+    try:
+        import httpx
+    except ImportError:
+        error("httpx is required for progress tracking")
+        info("Install with: pip install httpx")
+        return
+
+    header("Tracking All Downloads")
+
+    data = _api_request(cli_state, "/api/models/download-tasks", refresh=True)
+    if not data:
+        return
+
+    hashes = [t.get("hash") for t in data.get("data", [])
+              if t.get("status") in ("pending", "downloading") and t.get("hash")]
+    if not hashes:
+        info("📭 No active downloads to track")
+        return
+
+    async def _track_one(client, progress, task_id, tracking_hash) -> bool:
+        url = f"{cli_state.api_base}/api/models/add-from-civitai/{tracking_hash}"
+        try:
+            async with client.stream("GET", url) as response:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    try:
+                        event = _json.loads(line[5:].strip())
+                    except ValueError:
+                        continue
+                    if not isinstance(event, dict):
+                        continue
+
+                    status = event.get("status", "unknown")
+                    if status == "downloading":
+                        progress.update(task_id,
+                                        completed=event.get("progress", 0),
+                                        description=f"{_short_hash(tracking_hash)} {event.get('speed', '0 B/s')}")
+                    elif status == "completed":
+                        progress.update(task_id, completed=100,
+                                        description=f"{_short_hash(tracking_hash)} [green]done[/green]")
+                        return True
+                    elif status == "failed":
+                        progress.update(task_id,
+                                        description=f"{_short_hash(tracking_hash)} [red]failed[/red]")
+                        return False
+        except httpx.HTTPError as e:
+            error(f"Stream failed for {_short_hash(tracking_hash)}: {e}")
+        return False
+
+    async def _run():
+        # A single HTTP/2 connection multiplexes all SSE streams
+        async with _async_client(timeout=httpx.Timeout(10.0, read=None)) as client:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                TimeRemainingColumn(),
+                console=console,
+                transient=False,
+                refresh_per_second=10,
+            ) as progress:
+                task_ids = {h: progress.add_task(_short_hash(h), total=100) for h in hashes}
+                return await asyncio.gather(
+                    *[_track_one(client, progress, task_ids[h], h) for h in hashes])
+
+    try:
+        results = _get_loop().run_until_complete(_run())
+    except Exception as e:
+        error(f"Progress tracking failed: {e}")
+        return
+
+    completed = sum(1 for result in results if result)
+    if completed == len(results):
+        success(f"✅ All {completed} downloads completed")
+    else:
+        warning(f"⚠️  {completed} of {len(results)} downloads completed")
+
+
 # ==================== Download Task Management Commands ====================
 
 @app.command("download-tasks")
 def list_download_tasks(
     ctx: typer.Context,
     status_filter: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by status (downloading, paused, completed, failed, cancelled)"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format: table or json"),
+    refresh: bool = typer.Option(False, "--refresh", "--no-cache", help="Bypass the local response cache"),
 ):
     """List all download tasks with their current status"""
+    from rich.table import Table
+
     cli_state = ctx.obj
-    
-    header("Download Tasks")
-    
-    data = _api_request(cli_state, "/api/models/download-tasks")
+
+    if output == "table":
+        header("Download Tasks")
+
+    data = _api_request(cli_state, "/api/models/download-tasks", refresh=refresh)
     if not data:
         return
-    
+
+    if output == "json":
+        _print_json(data)
+        return
+
     tasks = data.get("data", [])
     
     if not tasks:
@@ -596,13 +995,7 @@ def list_download_tasks(
     for task in tasks:
         # Format status with colors
         status = task.get("status", "unknown")
-        status_colored = {
-            "downloading": "[green]downloading[/green]",
-            "paused": "[yellow]paused[/yellow]",
-            "completed": "[blue]completed[/blue]",
-            "failed": "[red]failed[/red]",
-            "cancelled": "[dim]cancelled[/dim]",
-        }.get(status, status)
+        status_colored = _TASK_STATUS_STYLE.get(status, status)
         
         # Format progress
         progress = task.get("progress", 0.0)
@@ -622,7 +1015,7 @@ def list_download_tasks(
             progress_str,
             task.get("speed", "0 B/s"),
             task.get("eta", "N/A"),
-            task.get("hash", "")[:16] + "..."
+            _short_hash(task.get("hash") or "")
         )
     
     console.print(table)
@@ -633,35 +1026,37 @@ def list_download_tasks(
 def show_download_task(
     ctx: typer.Context,
     task_hash: str = typer.Argument(..., help="Download task hash"),
+    output: str = typer.Option("table", "--output", "-o", help="Output format: table or json"),
 ):
     """Show detailed information for a specific download task"""
+    from rich.table import Table
+
     cli_state = ctx.obj
-    
-    header(f"Download Task Details")
-    
+
+    if output == "table":
+        header(f"Download Task Details")
+
     data = _api_request(cli_state, f"/api/models/download-tasks/{task_hash}")
     if not data:
         return
-    
+
+    if output == "json":
+        _print_json(data)
+        return
+
     task = data.get("data")
     if not task:
         error("Download task not found")
         return
     
     # Create details table
-    table = Table(title=f"Task: {task.get('hash', '')[:16]}...", show_header=True, header_style="bold cyan")
+    table = Table(title=f"Task: {_short_hash(task.get('hash') or '')}", show_header=True, header_style="bold cyan")
     table.add_column("Property", style="cyan", width=20)
     table.add_column("Value", style="white")
     
     # Format status with color
     status = task.get("status", "unknown")
-    status_colored = {
-        "downloading": "[green]downloading[/green]",
-        "paused": "[yellow]paused[/yellow]",
-        "completed": "[blue]completed[/blue]",
-        "failed": "[red]failed[/red]",
-        "cancelled": "[dim]cancelled[/dim]",
-    }.get(status, status)
+    status_colored = _TASK_STATUS_STYLE.get(status, status)
     
     table.add_row("Model Name", task.get("model_name", "Unknown"))
     table.add_row("Version Name", task.get("version_name", "Unknown"))
@@ -733,7 +1128,7 @@ def resume_download_task(
 def cancel_download_task(
     ctx: typer.Context,
     task_hash: str = typer.Argument(..., help="Download task hash to cancel"),
-    force: bool = typer.Option(False, "--force", "-f", help="Force cancellation without confirmation"),
+    force: bool = typer.Option(False, "--force", "-f", "--yes", "-y", help="Force cancellation without confirmation"),
 ):
     """Cancel a download task"""
     cli_state = ctx.obj
@@ -760,6 +1155,29 @@ def cancel_download_task(
         error(f"❌ {response.get('message', 'Failed to cancel download')}")
 
 
+@app.command("cancel-downloads")
+def cancel_download_tasks(
+    ctx: typer.Context,
+    task_hashes: List[str] = typer.Argument(..., help="Download task hashes to cancel"),
+    force: bool = typer.Option(False, "--force", "-f", "--yes", "-y", help="Force cancellation without confirmation"),
+):
+    """Cancel multiple download tasks with a single request"""
+    cli_state = ctx.obj
+
+    header("Cancelling Download Tasks")
+
+    # One confirmation and one batch request instead of N of each
+    if not force:
+        confirm = typer.confirm(
+            f"Are you sure you want to cancel {len(task_hashes)} downloads? "
+            "This will remove the partial files.")
+        if not confirm:
+            info("Cancellation aborted")
+            return
+
+    _batch_download_action(cli_state, "cancel", task_hashes)
+
+
 @app.command("remove-task")
 def remove_download_task(
     ctx: typer.Context,
@@ -784,10 +1202,58 @@ def remove_download_task(
         error(f"❌ {response.get('message', 'Failed to remove task')}")
 
 
+def _batch_download_action(cli_state: CLIState, action: str, task_hashes: List[str]):
+    """Send one batch-action request covering all given task hashes"""
+    data = {
+        # [*...] not list(...): the typer command named `list` above
+        # shadows the builtin in this module
+        "task_hashes": [*task_hashes],
+        "action": action
+    }
+
+    response = _api_post_request(cli_state, "/api/models/download-tasks/batch-action", data)
+    if not response:
+        return
+
+    if response.get("success"):
+        success(f"✅ {response.get('message', 'Batch action completed')}")
+    else:
+        error(f"❌ {response.get('message', 'Batch action failed')}")
+
+    for result in response.get("results", []):
+        marker = "[green]✓[/green]" if result.get("success") else "[red]✗[/red]"
+        console.print(f"  {marker} {_short_hash(result.get('hash') or '')} - {result.get('message', '')}")
+
+
+@app.command("batch-action")
+def batch_download_tasks_action(
+    ctx: typer.Context,
+    action: str = typer.Argument(..., help="Action to apply (pause, resume, cancel, remove)"),
+    task_hashes: List[str] = typer.Argument(..., help="Download task hashes"),
+):
+    """Apply an action to multiple download tasks with a single request"""
+    cli_state = ctx.obj
+
+    header(f"Batch {action.capitalize()} Download Tasks")
+    _batch_download_action(cli_state, action, task_hashes)
+
+
+@app.command("remove-tasks")
+def remove_download_tasks(
+    ctx: typer.Context,
+    task_hashes: List[str] = typer.Argument(..., help="Download task hashes to remove"),
+):
+    """Remove multiple download tasks with a single request"""
+    cli_state = ctx.obj
+
+    header("Removing Download Tasks")
+    _batch_download_action(cli_state, "remove", task_hashes)
+
+
 @app.command("clear-completed")
 def clear_completed_tasks(
     ctx: typer.Context,
-    force: bool = typer.Option(False, "--force", "-f", help="Force clear without confirmation"),
+    force: bool = typer.Option(False, "--force", "-f", "--yes", "-y", help="Force clear without confirmation"),
 ):
     """Remove all completed, failed, and cancelled download tasks"""
     cli_state = ctx.obj
@@ -813,6 +1279,8 @@ def clear_completed_tasks(
 
 def _api_delete_request(cli_state: CLIState, endpoint: str) -> Optional[Dict[str, Any]]:
     """Make a DELETE request to the API"""
+    import requests
+
     from .service import _is_service_running
     
     if not _is_service_running(cli_state):
@@ -821,8 +1289,9 @@ def _api_delete_request(cli_state: CLIState, endpoint: str) -> Optional[Dict[str
         return None
     
     try:
-        response = requests.delete(f"{cli_state.api_base}{endpoint}", timeout=30)
+        response = _get_session().delete(f"{cli_state.api_base}{endpoint}", timeout=(2, 30))
         if response.status_code in [200, 202, 204]:
+            _cache_invalidate(cli_state.api_base)
             return response.json() if response.text else {"success": True}
         else:
             error(f"API request failed: {response.status_code}")
@@ -2,28 +2,51 @@
 Service management commands
 """
 
-import subprocess
+import functools
+import socket
+import sys
 import time
 import os
-from datetime import datetime
 from typing import Optional
 
 import typer
-import psutil
-import requests
-from rich.table import Table
+
+# psutil, requests and subprocess are imported inside the functions that
+# need them; loading this module (which happens for every sdh command)
+# stays cheap
 
 from ..utils import console, success, error, warning, info, header, format_bytes, CLIState
 
 app = typer.Typer(help="Service management commands")
 
+# Shared HTTP session (created on first use) so repeated health probes
+# reuse a keep-alive connection instead of a fresh TCP handshake
+_http_session = None
+
+
+def _get_http_session():
+    """Get the shared requests.Session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        import atexit
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _http_session = requests.Session()
+        _http_session.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        atexit.register(_http_session.close)
+    return _http_session
+
+
 @app.command()
 def status(
     ctx: typer.Context,
 ):
     """Show service status and system information"""
+    from rich.table import Table
+
     cli_state = ctx.obj
-    
+
     header("SD-Host Service Status")
     
     status_info = _get_service_status(cli_state)
@@ -58,8 +81,10 @@ def start(
     ctx: typer.Context,
 ):
     """Start the SD-Host service"""
+    import subprocess
+
     cli_state = ctx.obj
-    
+
     if _is_service_running(cli_state):
         error("Service is already running")
         raise typer.Exit(1)
@@ -76,18 +101,39 @@ def start(
     
     with console.status("[bold blue]Starting SD-Host service..."):
         try:
-            # Start process in background
-            process = subprocess.Popen(
-                [str(cli_state.python_exe), str(cli_state.main_script)],
-                stdout=open(cli_state.log_file, 'w'),
-                stderr=subprocess.STDOUT,
-                cwd=str(cli_state.project_dir),
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
+            # Append (preserving earlier logs) without buffering layers;
+            # O_CLOEXEC keeps the fd out of unrelated children
+            log_fd = os.open(
+                cli_state.log_file,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0),
+                0o644
             )
+            try:
+                # Start process in background
+                process = subprocess.Popen(
+                    [str(cli_state.python_exe), str(cli_state.main_script)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_fd,
+                    stderr=subprocess.STDOUT,
+                    cwd=str(cli_state.project_dir),
+                    # Detach from the CLI's session so a Ctrl-C in the
+                    # parent shell never reaches the daemon
+                    start_new_session=os.name != 'nt',
+                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
+                )
+            finally:
+                # The child holds its own duplicate of the fd
+                os.close(log_fd)
             
-            # Save PID
+            # Save PID plus start ticks so a recycled PID is never
+            # mistaken for our service
+            start_ticks = (_linux_start_ticks(process.pid)
+                           if sys.platform.startswith('linux') else None)
             with open(cli_state.pid_file, 'w') as f:
-                f.write(str(process.pid))
+                if start_ticks:
+                    f.write(f"{process.pid} {start_ticks.decode()}")
+                else:
+                    f.write(str(process.pid))
             
             # Wait a moment and check if it started successfully
             time.sleep(3)
@@ -110,17 +156,18 @@ def stop(
     ctx: typer.Context,
 ):
     """Stop the SD-Host service"""
+    import psutil
+
     cli_state = ctx.obj
-    
-    pid = _is_service_running(cli_state)
-    
-    if not pid:
+
+    proc = _is_service_running(cli_state)
+
+    if not proc:
         error("Service is not running")
         raise typer.Exit(1)
-    
-    with console.status(f"[bold blue]Stopping SD-Host service (PID: {pid})..."):
+
+    with console.status(f"[bold blue]Stopping SD-Host service (PID: {proc.pid})..."):
         try:
-            proc = psutil.Process(pid)
             proc.terminate()
             
             # Wait for graceful shutdown
@@ -178,89 +225,217 @@ def logs(
         info(f"Following logs from: {cli_state.log_file}")
         info("Press Ctrl+C to stop")
         try:
-            # Use tail -f equivalent for Windows
-            if os.name == 'nt':
-                subprocess.run([
-                    "powershell", "-Command", 
-                    f"Get-Content '{cli_state.log_file}' -Tail {lines} -Wait"
-                ])
-            else:
-                subprocess.run(["tail", "-f", "-n", str(lines), str(cli_state.log_file)])
+            _follow(cli_state.log_file, lines)
         except KeyboardInterrupt:
             info("Stopped following logs")
     else:
         # Show last N lines
         try:
-            with open(cli_state.log_file, 'r', encoding='utf-8') as f:
-                lines_list = f.readlines()
-                for line in lines_list[-lines:]:
-                    console.print(line.rstrip())
+            for line in _tail(cli_state.log_file, lines):
+                console.print(line.rstrip())
         except Exception as e:
             error(f"Error reading log file: {e}")
             raise typer.Exit(1)
 
-def _is_service_running(cli_state: CLIState) -> Optional[int]:
-    """Check if SD-Host service is running, return PID if found"""
+
+def _tail(path, n: int) -> list:
+    """Read the last n lines of a file without loading the whole file
+
+    Seeks backwards from EOF in 64 KiB blocks until enough newlines are
+    collected, so memory stays O(n * line length) even on huge logs.
+    """
+    blocksize = 64 * 1024
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        remaining = f.tell()
+        buffer = bytearray()
+        while remaining > 0 and buffer.count(b'\n') <= n:
+            read_size = min(blocksize, remaining)
+            remaining -= read_size
+            f.seek(remaining)
+            buffer[:0] = f.read(read_size)
+    return [line.decode('utf-8', errors='replace')
+            for line in buffer.splitlines()[-n:]]
+
+
+def _follow(path, initial_lines: int):
+    """Follow a log file in-process, like tail -f
+
+    Polls for appended bytes every 100ms and reopens the file when it is
+    rotated, avoiding a tail/PowerShell subprocess per invocation.
+    """
+    import sys
+
+    for line in _tail(path, initial_lines):
+        console.print(line.rstrip())
+
+    f = open(path, 'rb')
+    try:
+        f.seek(0, os.SEEK_END)
+        while True:
+            chunk = f.read()
+            if chunk:
+                # One write per read cycle instead of one print per line;
+                # log lines pass through verbatim, Rich is only used for
+                # the surrounding decoration
+                sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+            else:
+                time.sleep(0.1)
+                try:
+                    # Reopen if the file was rotated out from under us
+                    if os.stat(path).st_ino != os.fstat(f.fileno()).st_ino:
+                        f.close()
+                        f = open(path, 'rb')
+                except FileNotFoundError:
+                    time.sleep(0.1)
+    finally:
+        f.close()
+
+# Status reported when no service process is found; copied per return
+# so callers can mutate their dict freely
+_STOPPED_STATUS = {
+    "running": False,
+    "pid": None,
+    "uptime": None,
+    "memory": None,
+    "cpu": None,
+    "api_accessible": False
+}
+
+
+def _linux_pid_alive(pid: int) -> bool:
+    """Liveness check via a single stat of /proc/<pid>"""
+    return os.path.exists(f"/proc/{pid}")
+
+
+def _linux_start_ticks(pid: int) -> Optional[bytes]:
+    """Process start time (field 22 of /proc/<pid>/stat) in clock ticks
+
+    Splitting after the last ')' keeps the parse correct even when the
+    command name contains spaces or parentheses.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", 'rb') as f:
+            data = f.read()
+        return data.rpartition(b')')[2].split()[19]
+    except (OSError, IndexError):
+        return None
+
+
+def _is_service_running(cli_state: CLIState) -> Optional["psutil.Process"]:
+    """Check if SD-Host service is running, return its Process if found"""
+    import psutil
+
     if not cli_state.pid_file.exists():
         return None
-    
+
+    pid = None
     try:
-        with open(cli_state.pid_file, 'r') as f:
-            pid = int(f.read().strip())
-        
-        # Check if process exists and is our python process
-        if psutil.pid_exists(pid):
-            return pid
-        
+        # Raw read of the tiny PID file; no buffered/text-wrapper layers
+        fd = os.open(cli_state.pid_file, os.O_RDONLY)
+        try:
+            raw = os.read(fd, 64)
+        finally:
+            os.close(fd)
+        parts = raw.split()
+        if not parts:
+            return None
+        pid = int(parts[0])
+        expected_ticks = parts[1] if len(parts) > 1 else None
+
+        if sys.platform.startswith('linux'):
+            # On Linux a dead PID is detected with one stat, skipping
+            # Process construction and its NoSuchProcess exception path
+            if not _linux_pid_alive(pid):
+                raise psutil.NoSuchProcess(pid)
+            # A different start time means the OS recycled our PID
+            if expected_ticks is not None and _linux_start_ticks(pid) != expected_ticks:
+                raise psutil.NoSuchProcess(pid)
+
+        # One Process lookup doubles as the existence check
+        proc = cli_state._proc_cache.get(pid)
+        if proc is None:
+            proc = psutil.Process(pid)
+            # Seed the CPU sampling window; the next cpu_percent()
+            # call returns a real delta instead of 0.0
+            proc.cpu_percent(interval=None)
+            cli_state._proc_cache[pid] = proc
+        elif os.name == 'posix':
+            # Liveness check on a cached Process is a single kill(2)
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                raise psutil.NoSuchProcess(pid)
+            except PermissionError:
+                pass  # Process exists but belongs to someone else
+        elif not proc.is_running():
+            raise psutil.NoSuchProcess(pid)
+        return proc
+
+    except (psutil.NoSuchProcess, PermissionError):
         # PID file exists but process is not running, clean up
-        cli_state.pid_file.unlink()
+        cli_state._proc_cache.pop(pid, None)
+        if cli_state.pid_file.exists():
+            cli_state.pid_file.unlink()
         return None
-        
-    except (ValueError, psutil.NoSuchProcess, PermissionError):
+    except ValueError:
         return None
 
 def _get_service_status(cli_state: CLIState) -> dict:
     """Get comprehensive service status"""
-    pid = _is_service_running(cli_state)
-    
-    if not pid:
-        return {
-            "running": False,
-            "pid": None,
-            "uptime": None,
-            "memory": None,
-            "cpu": None,
-            "api_accessible": False
-        }
-    
+    import psutil
+
+    proc = _is_service_running(cli_state)
+
+    if not proc:
+        return dict(_STOPPED_STATUS)
+
     try:
-        proc = psutil.Process(pid)
-        create_time = datetime.fromtimestamp(proc.create_time())
-        uptime = datetime.now() - create_time
-        
-        # Check API accessibility
-        api_accessible = False
-        try:
-            response = requests.get(f"{cli_state.api_base}/health", timeout=5)
-            api_accessible = response.status_code == 200
-        except:
-            pass
-        
-        return {
-            "running": True,
-            "pid": pid,
-            "uptime": str(uptime).split('.')[0],
-            "memory": format_bytes(proc.memory_info().rss),
-            "cpu": f"{proc.cpu_percent():.1f}%",
-            "api_accessible": api_accessible
-        }
-        
+        # At most one full snapshot per second even if callers repeat
+        return _status_snapshot(proc, cli_state.api_base, int(time.monotonic()))
     except psutil.NoSuchProcess:
-        return {
-            "running": False,
-            "pid": None,
-            "uptime": None,
-            "memory": None,
-            "cpu": None,
-            "api_accessible": False
-        }
+        cli_state._proc_cache.pop(proc.pid, None)
+        return dict(_STOPPED_STATUS)
+
+
+@functools.lru_cache(maxsize=1)
+def _status_snapshot(proc: "psutil.Process", api_base: str, ts_bucket: int) -> dict:
+    """Collect process metrics and API health for one 1-second bucket"""
+    # oneshot() batches the underlying /proc reads into one
+    with proc.oneshot():
+        create_time = proc.create_time()
+        memory_rss = proc.memory_info().rss
+        # Non-blocking; measured against the sample taken when the
+        # Process was cached. The first status after a cold cache
+        # still reports 0.0%.
+        cpu_percent = proc.cpu_percent(interval=None)
+
+    # Integer math instead of datetime/timedelta allocation
+    uptime_secs = int(time.time() - create_time)
+    hours, rest = divmod(uptime_secs, 3600)
+    minutes, seconds = divmod(rest, 60)
+
+    # Check API accessibility; a cheap TCP probe first so a dead port
+    # costs ~200ms instead of a full HTTP timeout
+    api_accessible = False
+    host, _, port = api_base.rsplit("://", 1)[-1].partition(":")
+    sock = socket.socket()
+    sock.settimeout(0.2)
+    try:
+        if sock.connect_ex((host, int(port))) == 0:
+            response = _get_http_session().get(f"{api_base}/health", timeout=1.0)
+            api_accessible = response.status_code == 200
+    except:
+        pass
+    finally:
+        sock.close()
+
+    return {
+        "running": True,
+        "pid": proc.pid,
+        "uptime": f"{hours}:{minutes:02d}:{seconds:02d}",
+        "memory": format_bytes(memory_rss),
+        "cpu": f"{cpu_percent:.1f}%",
+        "api_accessible": api_accessible
+    }
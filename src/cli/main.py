@@ -13,10 +13,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from rich import print
-from rich.panel import Panel
 
-from cli.utils import CLIState
+# rich and CLIState (and through it core.config/pydantic) are imported
+# lazily inside the commands so `sdh --help`/`--version` skip them
 from cli.commands import config, service, models, images, tasks
 
 # Create main app
@@ -25,7 +24,10 @@ app = typer.Typer(
     help="[bold blue]SD-Host CLI Tool[/bold blue] - Manage SD-Host service and query status",
     epilog="Visit https://github.com/wewei/sd-host for more information.",
     rich_markup_mode="rich",
-    no_args_is_help=True
+    no_args_is_help=True,
+    # Shell-completion options add a hidden click group with import-time
+    # side effects; skip them to keep every invocation cheaper
+    add_completion=False
 )
 
 # Add subcommands
@@ -38,6 +40,8 @@ app.add_typer(config.app, name="config", help="📝 Configuration management")
 @app.command(name="version")
 def version_command():
     """Show version information"""
+    from rich import print
+
     print("[bold blue]SD-Host CLI[/bold blue] version [green]1.0.0[/green]")
 
 @app.callback(invoke_without_command=True)
@@ -77,22 +81,34 @@ def main(
     3. Default: ~/sd-host/depot
     """
     if version:
+        from rich import print
+
         print("[bold blue]SD-Host CLI[/bold blue] version [green]1.0.0[/green]")
         raise typer.Exit()
-    
+
     # Initialize CLI state and pass to all subcommands
     if ctx.invoked_subcommand is not None:
-        ctx.obj = CLIState(depot_dir=depot, config_path=config_path)
-        
+        from cli.utils import CLIState
+
+        # Only config commands mutate settings; everything else can share
+        # the cached read-only instance
+        readonly = ctx.invoked_subcommand != "config"
+        ctx.obj = CLIState(depot_dir=depot, config_path=config_path, readonly=readonly)
+
         if verbose:
+            from rich import print
+
             print(f"[dim]Using depot: {ctx.obj.settings.depot_dir}[/dim]")
             print(f"[dim]Config loaded from: {config_path or 'default'}[/dim]")
 
 @app.command(name="info")
 def show_info(ctx: typer.Context):
     """Show system information and configuration summary"""
+    from rich import print
+    from rich.panel import Panel
+
     cli_state = ctx.obj
-    
+
     config_path = None
     try:
         from core.config import get_config_file_path
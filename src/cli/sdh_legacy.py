@@ -8,29 +8,146 @@ import os
 import sys
 import json
 import time
-import psutil
 import argparse
-import subprocess
+import functools
+import operator
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional
-import requests
-from datetime import datetime
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json works everywhere
+    import json as _json
+
+# psutil, requests, subprocess and datetime are imported inside the
+# methods that need them so config-only invocations skip their cost
 
 # Add src to Python path for imports (CLI is in src/cli/ subdirectory)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from core.config import get_settings, reload_settings, get_config_file_path
 
+# Decide color support once at import: piped output (`sdh ... > out.txt`)
+# and NO_COLOR environments get plain text, which also skips the escape
+# concatenation in every formatted line
+_USE_COLOR = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
+
 class Colors:
-    """ANSI color codes for terminal output"""
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    END = '\033[0m'
+    """ANSI color codes for terminal output (empty when colors are disabled)"""
+    GREEN = '\033[92m' if _USE_COLOR else ''
+    RED = '\033[91m' if _USE_COLOR else ''
+    YELLOW = '\033[93m' if _USE_COLOR else ''
+    BLUE = '\033[94m' if _USE_COLOR else ''
+    CYAN = '\033[96m' if _USE_COLOR else ''
+    WHITE = '\033[97m' if _USE_COLOR else ''
+    BOLD = '\033[1m' if _USE_COLOR else ''
+    END = '\033[0m' if _USE_COLOR else ''
+
+# Configuration keys for `sdh config show`, as (display key, attribute
+# path) pairs. Most display keys mirror the attribute path; top-level
+# convenience properties (app.name -> app_name etc.) are mapped
+# explicitly. Static, so the alignment width is computed once here.
+_CONFIG_KEYS = (
+    # App info
+    ("app.name", "app_name"),
+    ("app.version", "app_version"),
+
+    # Storage
+    ("storage.depot_dir", "depot_dir"),
+    ("storage.models_dir", "models_dir"),
+    ("storage.output_dir", "output_dir"),
+    ("storage.data_dir", "data_dir"),
+    ("storage.database_url", "database_url"),
+    ("storage.max_images", "storage.max_images"),
+    ("storage.cleanup_interval", "storage.cleanup_interval"),
+    ("storage.image_retention_days", "storage.image_retention_days"),
+
+    # Server
+    ("server.host", "server.host"),
+    ("server.port", "server.port"),
+    ("server.debug", "server.debug"),
+    ("server.workers", "server.workers"),
+    ("server.reload", "server.reload"),
+
+    # Stable Diffusion
+    ("stable_diffusion.model_name", "stable_diffusion.model_name"),
+    ("stable_diffusion.model_path", "stable_diffusion.model_path"),
+    ("stable_diffusion.device", "stable_diffusion.device"),
+    ("stable_diffusion.device_id", "stable_diffusion.device_id"),
+    ("stable_diffusion.precision", "stable_diffusion.precision"),
+    ("stable_diffusion.attention_slicing", "stable_diffusion.attention_slicing"),
+    ("stable_diffusion.memory_efficient_attention", "stable_diffusion.memory_efficient_attention"),
+    ("stable_diffusion.cpu_offload", "stable_diffusion.cpu_offload"),
+    ("stable_diffusion.default_width", "stable_diffusion.default_width"),
+    ("stable_diffusion.default_height", "stable_diffusion.default_height"),
+    ("stable_diffusion.default_steps", "stable_diffusion.default_steps"),
+    ("stable_diffusion.default_cfg_scale", "stable_diffusion.default_cfg_scale"),
+    ("stable_diffusion.default_sampler", "stable_diffusion.default_sampler"),
+    ("stable_diffusion.safety_checker", "stable_diffusion.safety_checker"),
+    ("stable_diffusion.nsfw_filter", "stable_diffusion.nsfw_filter"),
+
+    # API
+    ("api.rate_limit_requests", "api.rate_limit_requests"),
+    ("api.rate_limit_window", "api.rate_limit_window"),
+    ("api.timeout", "api.timeout"),
+    ("api.max_request_size", "api.max_request_size"),
+    ("api.cors_origins", "api.cors_origins"),
+    ("api.cors_methods", "api.cors_methods"),
+    ("api.cors_headers", "api.cors_headers"),
+    ("api.api_prefix", "api.api_prefix"),
+
+    # Civitai
+    ("civitai.api_key", "civitai.api_key"),
+    ("civitai.base_url", "civitai.base_url"),
+
+    # Proxy
+    ("proxy.http_proxy", "proxy.http_proxy"),
+    ("proxy.https_proxy", "proxy.https_proxy"),
+
+    # Logging
+    ("logging.level", "logging.level"),
+    ("logging.format", "logging.format"),
+    ("logging.file", "logging.file"),
+    ("logging.max_size", "logging.max_size"),
+    ("logging.backup_count", "logging.backup_count"),
+
+    # Security
+    ("security.api_key_enabled", "security.api_key_enabled"),
+    ("security.api_key", "security.api_key"),
+    ("security.ssl_enabled", "security.ssl_enabled"),
+    ("security.ssl_cert_file", "security.ssl_cert_file"),
+    ("security.ssl_key_file", "security.ssl_key_file"),
+
+    # Monitoring
+    ("monitoring.health_check_enabled", "monitoring.health_check_enabled"),
+    ("monitoring.metrics_enabled", "monitoring.metrics_enabled"),
+    ("monitoring.metrics_endpoint", "monitoring.metrics_endpoint"),
+    ("monitoring.track_performance", "monitoring.track_performance"),
+
+    # File
+    ("file.max_file_size", "file.max_file_size"),
+    ("file.allowed_extensions", "file.allowed_extensions"),
+)
+_MAX_KEY_LEN = max(len(key) for key, _ in _CONFIG_KEYS)
+
+# Status-to-color tables built once at import so the print helpers do a
+# plain dict lookup instead of rebuilding a dict (and re-concatenating
+# escape codes) on every call
+_MESSAGE_COLORS = {
+    "info": Colors.BLUE,
+    "success": Colors.GREEN,
+    "warning": Colors.YELLOW,
+    "error": Colors.RED,
+    "header": Colors.CYAN + Colors.BOLD,
+}
+_STATUS_WRAPPED = {
+    "ready": f"{Colors.GREEN}ready{Colors.END}",
+    "downloading": f"{Colors.YELLOW}downloading{Colors.END}",
+    "error": f"{Colors.RED}error{Colors.END}",
+    "pending": f"{Colors.BLUE}pending{Colors.END}",
+}
+
 
 class SDHostCLI:
     """SD-Host CLI management tool"""
@@ -43,26 +160,47 @@ class SDHostCLI:
         
         # Load configuration with depot override
         self.settings = get_settings(config_path, depot_dir)
+
+        # Resolve the config file location once; the config commands all
+        # need it and the answer never changes within a run
+        self._config_path = get_config_file_path()
         
         # Set up paths based on configuration
         self.pid_file = Path(self.settings.depot_dir) / ".sdh.pid"
+        self.cpu_cache_file = Path(self.settings.depot_dir) / ".sdh.cpu"
         self.log_file = Path(self.settings.logging.file)
         self.api_base = f"http://{self.settings.host}:{self.settings.port}"
         
         # Ensure directories exist
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         Path(self.settings.depot_dir).mkdir(parents=True, exist_ok=True)
+
+        # (pid, psutil.Process) of the last verified service process, so
+        # repeated checks skip reconstruction and re-verification
+        self._proc_cache = None
+
+        # Keep-alive session, created on first use so config-only
+        # commands never import requests
+        self._session = None
+
+        # Compiled attrgetters for dotted config keys, and the matching
+        # (container getter, attribute) pairs for writes
+        self._attrgetter_cache = {}
+        self._setter_cache = {}
+
+    def _get_session(self):
+        """Get the shared requests.Session, creating it on first use"""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+            self._session.mount("http://", requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=1))
+        return self._session
     
     def print_status(self, message: str, status: str = "info"):
         """Print colored status message"""
-        colors = {
-            "info": Colors.BLUE,
-            "success": Colors.GREEN,
-            "warning": Colors.YELLOW,
-            "error": Colors.RED,
-            "header": Colors.CYAN + Colors.BOLD
-        }
-        color = colors.get(status, Colors.WHITE)
+        color = _MESSAGE_COLORS.get(status, Colors.WHITE)
         print(f"{color}{message}{Colors.END}")
     
     def print_header(self, text: str):
@@ -73,28 +211,64 @@ class SDHostCLI:
     
     def is_service_running(self) -> Optional[int]:
         """Check if SD-Host service is running, return PID if found"""
+        import psutil
+
         if not self.pid_file.exists():
             return None
         
         try:
             with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
-            
+                # The typer CLI appends start ticks after the PID on
+                # Linux; only the first token matters here
+                pid = int(f.read().split()[0])
+
+            # Already verified this PID? A zero-signal kill answers
+            # liveness in one syscall, no psutil machinery
+            if self._proc_cache and self._proc_cache[0] == pid:
+                if os.name == 'posix':
+                    try:
+                        os.kill(pid, 0)
+                        return pid
+                    except ProcessLookupError:
+                        self._proc_cache = None
+                    except PermissionError:
+                        return pid  # Exists, just not ours to signal
+                elif self._proc_cache[1].is_running():
+                    return pid
+                else:
+                    self._proc_cache = None
+
             # Check if process exists and is our python process
             if psutil.pid_exists(pid):
                 proc = psutil.Process(pid)
-                if 'python' in proc.name().lower() and 'main.py' in ' '.join(proc.cmdline()):
-                    return pid
-            
+                # exe() is a single readlink; only read the full cmdline
+                # when the executable path doesn't settle it
+                try:
+                    if proc.exe() == str(self.python_exe):
+                        self._proc_cache = (pid, proc)
+                        return pid
+                except (psutil.AccessDenied, psutil.ZombieProcess):
+                    pass
+                # oneshot() batches name() and cmdline() into one read;
+                # any() short-circuits without joining the argv list
+                with proc.oneshot():
+                    if 'python' in proc.name().lower() and any(
+                            'main.py' in arg for arg in proc.cmdline()):
+                        self._proc_cache = (pid, proc)
+                        return pid
+
             # PID file exists but process is not running, clean up
             self.pid_file.unlink()
             return None
-            
-        except (ValueError, psutil.NoSuchProcess, PermissionError):
+
+        except (ValueError, IndexError, psutil.NoSuchProcess, PermissionError):
             return None
     
     def get_service_status(self) -> Dict:
         """Get comprehensive service status"""
+        import psutil
+        from datetime import datetime
+
         pid = self.is_service_running()
         
         if not pid:
@@ -108,14 +282,20 @@ class SDHostCLI:
             }
         
         try:
-            proc = psutil.Process(pid)
-            create_time = datetime.fromtimestamp(proc.create_time())
+            # is_service_running just cached the verified Process
+            proc = (self._proc_cache[1] if self._proc_cache and self._proc_cache[0] == pid
+                    else psutil.Process(pid))
+            # Batch the metric reads into a single kernel query
+            with proc.oneshot():
+                create_time = datetime.fromtimestamp(proc.create_time())
+                memory_rss = proc.memory_info().rss
+                cpu_percent = self._sample_cpu_percent(proc, pid)
             uptime = datetime.now() - create_time
-            
+
             # Check API accessibility
             api_accessible = False
             try:
-                response = requests.get(f"{self.api_base}/health", timeout=5)
+                response = self._get_session().get(f"{self.api_base}/health", timeout=5)
                 api_accessible = response.status_code == 200
             except:
                 pass
@@ -124,8 +304,8 @@ class SDHostCLI:
                 "running": True,
                 "pid": pid,
                 "uptime": str(uptime).split('.')[0],  # Remove microseconds
-                "memory": f"{proc.memory_info().rss / 1024 / 1024:.1f} MB",
-                "cpu": f"{proc.cpu_percent():.1f}%",
+                "memory": f"{memory_rss / 1024 / 1024:.1f} MB",
+                "cpu": f"{cpu_percent:.1f}%",
                 "api_accessible": api_accessible
             }
             
@@ -139,8 +319,35 @@ class SDHostCLI:
                 "api_accessible": False
             }
     
+    def _sample_cpu_percent(self, proc, pid: int) -> float:
+        """Sample CPU usage with a 1s floor between readings.
+
+        cpu_percent(interval=None) needs two samples to be meaningful and
+        the CLI process is short-lived, so the last reading is persisted
+        to depot_dir/.sdh.cpu. Back-to-back `sdh service status` calls
+        within a second reuse it instead of reporting 0.0.
+        """
+        now = time.time()
+        try:
+            with open(self.cpu_cache_file, 'r') as f:
+                cached = json.load(f)
+            if cached.get("pid") == pid and 0 <= now - cached.get("ts", 0) < 1.0:
+                return cached.get("value", 0.0)
+        except (OSError, ValueError):
+            pass
+
+        value = proc.cpu_percent()
+        try:
+            with open(self.cpu_cache_file, 'w') as f:
+                json.dump({"pid": pid, "ts": now, "value": value}, f)
+        except OSError:
+            pass
+        return value
+
     def start_service(self) -> bool:
         """Start SD-Host service"""
+        import subprocess
+
         if self.is_service_running():
             self.print_status("❌ Service is already running", "error")
             return False
@@ -158,80 +365,131 @@ class SDHostCLI:
         self.print_status("🚀 Starting SD-Host service...", "info")
         
         try:
-            # Start process in background
-            process = subprocess.Popen(
-                [str(self.python_exe), str(self.main_script)],
-                stdout=open(self.log_file, 'w'),
-                stderr=subprocess.STDOUT,
-                cwd=str(self.project_dir),
-                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
-            )
+            # Open the log in append mode via a raw fd: no buffered-file
+            # wrapper to leak, and history survives restarts instead of
+            # being truncated on every start
+            log_fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                # Start process in background
+                process = subprocess.Popen(
+                    [str(self.python_exe), str(self.main_script)],
+                    stdout=log_fd,
+                    stderr=subprocess.STDOUT,
+                    cwd=str(self.project_dir),
+                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if os.name == 'nt' else 0
+                )
+            finally:
+                # The child inherited the fd; the parent's copy is done
+                os.close(log_fd)
             
             # Save PID
             with open(self.pid_file, 'w') as f:
                 f.write(str(process.pid))
-            
-            # Wait a moment and check if it started successfully
-            time.sleep(3)
-            
-            if self.is_service_running():
-                self.print_status("✅ Service started successfully", "success")
-                self.print_status(f"📝 Logs: {self.log_file}", "info")
-                
-                # Wait for API to be accessible
-                self.print_status("⏳ Waiting for API to be ready...", "info")
-                for i in range(10):
-                    try:
-                        response = requests.get(f"{self.api_base}/health", timeout=2)
-                        if response.status_code == 200:
-                            self.print_status("🌐 API is accessible", "success")
-                            break
-                    except:
-                        pass
-                    time.sleep(1)
-                else:
-                    self.print_status("⚠️  Service started but API may not be ready yet", "warning")
-                
-                return True
-            else:
-                self.print_status("❌ Failed to start service", "error")
-                return False
+
+            # Poll process liveness and /health right away instead of a
+            # fixed grace sleep: fast startups succeed as soon as the API
+            # answers, and early crashes are reported immediately.
+            # Backoff 100ms, 200ms, ... capped at 1s against a deadline.
+            self.print_status("⏳ Waiting for API to be ready...", "info")
+            deadline = time.monotonic() + 13
+            delay = 0.1
+            while time.monotonic() < deadline:
+                if process.poll() is not None:
+                    self.print_status("❌ Failed to start service", "error")
+                    self.print_status(f"📝 Check logs: {self.log_file}", "info")
+                    if self.pid_file.exists():
+                        self.pid_file.unlink()
+                    return False
+                try:
+                    response = self._get_session().get(f"{self.api_base}/health", timeout=0.5)
+                    if response.status_code == 200:
+                        self.print_status("✅ Service started successfully", "success")
+                        self.print_status(f"📝 Logs: {self.log_file}", "info")
+                        self.print_status("🌐 API is accessible", "success")
+                        return True
+                except:
+                    pass
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
+
+            self.print_status("⚠️  Service started but API may not be ready yet", "warning")
+            self.print_status(f"📝 Logs: {self.log_file}", "info")
+            return True
                 
         except Exception as e:
             self.print_status(f"❌ Error starting service: {e}", "error")
             return False
     
+    def _wait_for_exit(self, pid: int, timeout: float) -> bool:
+        """Poll until a PID is gone, reaping it if it is our child.
+
+        Uses plain signal-0 liveness checks plus a non-blocking waitpid
+        (so a service spawned by this very process, e.g. during restart,
+        doesn't linger as a zombie) instead of psutil's wait machinery.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                pass  # Not our child; signal check below still works
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            time.sleep(0.1)
+        return False
+
     def stop_service(self) -> bool:
         """Stop SD-Host service"""
         pid = self.is_service_running()
-        
+
         if not pid:
             self.print_status("❌ Service is not running", "error")
             return False
-        
+
         self.print_status(f"🛑 Stopping SD-Host service (PID: {pid})...", "info")
-        
+
         try:
-            proc = psutil.Process(pid)
-            proc.terminate()
-            
-            # Wait for graceful shutdown
-            try:
-                proc.wait(timeout=10)
-            except psutil.TimeoutExpired:
-                self.print_status("⚠️  Forcing shutdown...", "warning")
-                proc.kill()
-                proc.wait(timeout=5)
-            
+            if os.name == 'posix':
+                # Plain signals: no psutil Process construction needed
+                import signal
+
+                os.kill(pid, signal.SIGTERM)
+                if not self._wait_for_exit(pid, timeout=10):
+                    self.print_status("⚠️  Forcing shutdown...", "warning")
+                    os.kill(pid, signal.SIGKILL)
+                    self._wait_for_exit(pid, timeout=5)
+            else:
+                import psutil
+
+                try:
+                    proc = (self._proc_cache[1] if self._proc_cache and self._proc_cache[0] == pid
+                            else psutil.Process(pid))
+                    proc.terminate()
+
+                    # Wait for graceful shutdown
+                    try:
+                        proc.wait(timeout=10)
+                    except psutil.TimeoutExpired:
+                        self.print_status("⚠️  Forcing shutdown...", "warning")
+                        proc.kill()
+                        proc.wait(timeout=5)
+                except psutil.NoSuchProcess:
+                    raise ProcessLookupError(pid) from None
+
+            self._proc_cache = None
+
             # Clean up PID file
             if self.pid_file.exists():
                 self.pid_file.unlink()
-            
+
             self.print_status("✅ Service stopped successfully", "success")
             return True
-            
-        except psutil.NoSuchProcess:
+
+        except ProcessLookupError:
             self.print_status("❌ Process not found", "error")
+            self._proc_cache = None
             if self.pid_file.exists():
                 self.pid_file.unlink()
             return False
@@ -275,14 +533,18 @@ class SDHostCLI:
     
     def api_request(self, endpoint: str) -> Optional[Dict]:
         """Make API request to SD-Host service"""
+        import requests
+
         if not self.is_service_running():
             self.print_status("❌ Service is not running", "error")
             return None
         
         try:
-            response = requests.get(f"{self.api_base}{endpoint}", timeout=10)
+            response = self._get_session().get(f"{self.api_base}{endpoint}", timeout=10)
             if response.status_code == 200:
-                return response.json()
+                # orjson parses the raw bytes noticeably faster than
+                # response.json() on large model lists
+                return _json.loads(response.content)
             else:
                 self.print_status(f"❌ API error: {response.status_code}", "error")
                 return None
@@ -330,40 +592,34 @@ class SDHostCLI:
         
         models = data.get("data", [])
         total = len(models)
-        
+
         if total == 0:
             self.print_status("📭 No models found", "info")
             return
+
+        # Count by status/type with Counter (C-level aggregation) instead
+        # of a per-model dict.get() loop
+        attrs_list = [model.get("attributes", {}) for model in models]
+        status_counts = Counter(attrs.get("status", "unknown") for attrs in attrs_list)
+        type_counts = Counter(attrs.get("model_type", "unknown") for attrs in attrs_list)
+        total_size = sum(attrs.get("size", 0) for attrs in attrs_list)
         
-        # Count by status
-        status_counts = {}
-        type_counts = {}
-        total_size = 0
-        
-        for model in models:
-            attrs = model.get("attributes", {})
-            status = attrs.get("status", "unknown")
-            model_type = attrs.get("model_type", "unknown")
-            size = attrs.get("size", 0)
-            
-            status_counts[status] = status_counts.get(status, 0) + 1
-            type_counts[model_type] = type_counts.get(model_type, 0) + 1
-            total_size += size
-        
-        # Display summary
+        # Display summary; most_common() sorts once so the breakdowns
+        # render deterministically (largest bucket first), and the lines
+        # go out in a single stdout write like show_config
         self.print_status(f"📊 Total Models: {total}", "info")
         self.print_status(f"💾 Total Size: {total_size / (1024**3):.2f} GB", "info")
-        print()
-        
-        self.print_status("📈 By Status:", "header")
-        for status, count in status_counts.items():
-            print(f"   {self._colored_status(status)}: {count}")
-        print()
-        
-        self.print_status("🏷️  By Type:", "header")
-        for model_type, count in type_counts.items():
-            print(f"   {model_type}: {count}")
-        print()
+
+        lines = [""]
+        lines.append(f"{_MESSAGE_COLORS['header']}📈 By Status:{Colors.END}")
+        for status, count in status_counts.most_common():
+            lines.append(f"   {self._colored_status(status)}: {count}")
+        lines.append("")
+        lines.append(f"{_MESSAGE_COLORS['header']}🏷️  By Type:{Colors.END}")
+        for model_type, count in type_counts.most_common():
+            lines.append(f"   {model_type}: {count}")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def show_tasks_list(self):
         """Display list of tasks"""
@@ -385,118 +641,38 @@ class SDHostCLI:
         self.print_header("SD-Host Configuration")
         
         # Configuration file info
-        config_path = get_config_file_path()
+        config_path = self._config_path
         config_status = "exists" if config_path.exists() else "using defaults"
-        print(f"{Colors.CYAN}Configuration File:{Colors.END} {config_path} ({config_status})")
-        print()
-        
-        # Show all configuration values in key=value format
-        config_items = [
-            # App info
-            ("app.name", self.settings.app_name),
-            ("app.version", self.settings.app_version),
-            
-            # Storage
-            ("storage.depot_dir", self.settings.depot_dir),
-            ("storage.models_dir", self.settings.models_dir),
-            ("storage.output_dir", self.settings.output_dir),
-            ("storage.data_dir", self.settings.data_dir),
-            ("storage.database_url", self.settings.database_url),
-            ("storage.max_images", self.settings.storage.max_images),
-            ("storage.cleanup_interval", self.settings.storage.cleanup_interval),
-            ("storage.image_retention_days", self.settings.storage.image_retention_days),
-            
-            # Server
-            ("server.host", self.settings.server.host),
-            ("server.port", self.settings.server.port),
-            ("server.debug", self.settings.server.debug),
-            ("server.workers", self.settings.server.workers),
-            ("server.reload", self.settings.server.reload),
-            
-            # Stable Diffusion
-            ("stable_diffusion.model_name", self.settings.stable_diffusion.model_name),
-            ("stable_diffusion.model_path", self.settings.stable_diffusion.model_path),
-            ("stable_diffusion.device", self.settings.stable_diffusion.device),
-            ("stable_diffusion.device_id", self.settings.stable_diffusion.device_id),
-            ("stable_diffusion.precision", self.settings.stable_diffusion.precision),
-            ("stable_diffusion.attention_slicing", self.settings.stable_diffusion.attention_slicing),
-            ("stable_diffusion.memory_efficient_attention", self.settings.stable_diffusion.memory_efficient_attention),
-            ("stable_diffusion.cpu_offload", self.settings.stable_diffusion.cpu_offload),
-            ("stable_diffusion.default_width", self.settings.stable_diffusion.default_width),
-            ("stable_diffusion.default_height", self.settings.stable_diffusion.default_height),
-            ("stable_diffusion.default_steps", self.settings.stable_diffusion.default_steps),
-            ("stable_diffusion.default_cfg_scale", self.settings.stable_diffusion.default_cfg_scale),
-            ("stable_diffusion.default_sampler", self.settings.stable_diffusion.default_sampler),
-            ("stable_diffusion.safety_checker", self.settings.stable_diffusion.safety_checker),
-            ("stable_diffusion.nsfw_filter", self.settings.stable_diffusion.nsfw_filter),
-            
-            # API
-            ("api.rate_limit_requests", self.settings.api.rate_limit_requests),
-            ("api.rate_limit_window", self.settings.api.rate_limit_window),
-            ("api.timeout", self.settings.api.timeout),
-            ("api.max_request_size", self.settings.api.max_request_size),
-            ("api.cors_origins", str(self.settings.api.cors_origins)),
-            ("api.cors_methods", str(self.settings.api.cors_methods)),
-            ("api.cors_headers", str(self.settings.api.cors_headers)),
-            ("api.api_prefix", self.settings.api.api_prefix),
-            
-            # Civitai
-            ("civitai.api_key", self.settings.civitai.api_key or "(not set)"),
-            ("civitai.base_url", self.settings.civitai.base_url),
-            
-            # Proxy
-            ("proxy.http_proxy", self.settings.proxy.http_proxy or "(not set)"),
-            ("proxy.https_proxy", self.settings.proxy.https_proxy or "(not set)"),
-            
-            # Logging
-            ("logging.level", self.settings.logging.level),
-            ("logging.format", self.settings.logging.format),
-            ("logging.file", self.settings.logging.file),
-            ("logging.max_size", self.settings.logging.max_size),
-            ("logging.backup_count", self.settings.logging.backup_count),
-            
-            # Security
-            ("security.api_key_enabled", self.settings.security.api_key_enabled),
-            ("security.api_key", self.settings.security.api_key or "(not set)"),
-            ("security.ssl_enabled", self.settings.security.ssl_enabled),
-            ("security.ssl_cert_file", self.settings.security.ssl_cert_file or "(not set)"),
-            ("security.ssl_key_file", self.settings.security.ssl_key_file or "(not set)"),
-            
-            # Monitoring
-            ("monitoring.health_check_enabled", self.settings.monitoring.health_check_enabled),
-            ("monitoring.metrics_enabled", self.settings.monitoring.metrics_enabled),
-            ("monitoring.metrics_endpoint", self.settings.monitoring.metrics_endpoint),
-            ("monitoring.track_performance", self.settings.monitoring.track_performance),
-            
-            # File
-            ("file.max_file_size", self.settings.file.max_file_size),
-            ("file.allowed_extensions", str(self.settings.file.allowed_extensions)),
+
+        # Build all configuration lines in key=value format, resolving
+        # each attribute on the fly from the static key table, then emit
+        # them in one stdout write instead of one per line
+        lines = [
+            f"{Colors.CYAN}Configuration File:{Colors.END} {config_path} ({config_status})",
+            "",
         ]
-        
-        # Calculate max key length for alignment
-        max_key_length = max(len(key) for key, _ in config_items)
-        
-        # Print all configuration items
-        for key, value in config_items:
+        for key, attr_path in _CONFIG_KEYS:
+            value = self._get_nested_value(attr_path)
+
             # Format the value
             if isinstance(value, bool):
                 value_str = f"{Colors.GREEN}true{Colors.END}" if value else f"{Colors.RED}false{Colors.END}"
-            elif isinstance(value, str) and value == "(not set)":
+            elif value is None or value == "":
                 value_str = f"{Colors.YELLOW}(not set){Colors.END}"
             elif isinstance(value, (int, float)):
                 value_str = f"{Colors.BLUE}{value}{Colors.END}"
             else:
                 value_str = str(value)
-            
-            # Print with alignment
-            print(f"{Colors.CYAN}{key:<{max_key_length}}{Colors.END} = {value_str}")
-        
-        print()
-        print(f"{Colors.YELLOW}💡 Tip:{Colors.END} Use 'sdh config set <key> <value>' to modify configuration values")
+
+            lines.append(f"{Colors.CYAN}{key:<{_MAX_KEY_LEN}}{Colors.END} = {value_str}")
+
+        lines.append("")
+        lines.append(f"{Colors.YELLOW}💡 Tip:{Colors.END} Use 'sdh config set <key> <value>' to modify configuration values")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def show_config_path(self):
         """Show configuration file path"""
-        config_path = get_config_file_path()
+        config_path = self._config_path
         print(f"Configuration file: {config_path}")
         if config_path.exists():
             print(f"Status: {Colors.GREEN}exists{Colors.END}")
@@ -506,9 +682,9 @@ class SDHostCLI:
     def init_config(self):
         """Initialize configuration file"""
         from core.config import save_config
-        
-        config_path = get_config_file_path()
-        
+
+        config_path = self._config_path
+
         if config_path.exists():
             print(f"{Colors.YELLOW}Configuration file already exists at:{Colors.END}")
             print(f"  {config_path}")
@@ -585,39 +761,43 @@ class SDHostCLI:
     
     def _get_nested_value(self, key: str):
         """Get nested configuration value using dot notation"""
-        parts = key.split('.')
-        current = self.settings
-        
-        for part in parts:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return None
-        
-        return current
+        # attrgetter traverses the dotted path in C; cache the compiled
+        # getters so repeated lookups skip re-parsing the key
+        getter = self._attrgetter_cache.get(key)
+        if getter is None:
+            getter = self._attrgetter_cache[key] = operator.attrgetter(key)
+        try:
+            return getter(self.settings)
+        except AttributeError:
+            return None
     
     def _set_nested_value(self, key: str, value) -> bool:
         """Set nested configuration value using dot notation"""
-        parts = key.split('.')
-        current = self.settings
-        
-        # Navigate to the parent object
-        for part in parts[:-1]:
-            if hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return False
-        
-        # Set the final value
-        final_key = parts[-1]
-        if hasattr(current, final_key):
-            setattr(current, final_key, value)
-            # Recalculate paths if we modified storage settings
-            if parts[0] == 'storage':
-                self.settings._resolve_paths()
-            return True
-        
-        return False
+        # Split the key once into (container getter, attribute) and cache
+        # the pair, so repeated sets do a single C-level traversal instead
+        # of a hasattr/getattr walk per path segment
+        entry = self._setter_cache.get(key)
+        if entry is None:
+            container_path, _, attr = key.rpartition('.')
+            entry = self._setter_cache[key] = (
+                operator.attrgetter(container_path) if container_path else None,
+                attr,
+            )
+
+        container_getter, attr = entry
+        try:
+            container = container_getter(self.settings) if container_getter else self.settings
+        except AttributeError:
+            return False
+
+        if not hasattr(container, attr):
+            return False
+
+        setattr(container, attr, value)
+        # Recalculate paths if we modified storage settings
+        if key.partition('.')[0] == 'storage':
+            self.settings._resolve_paths()
+        return True
     
     def _parse_config_value(self, key: str, value: str):
         """Parse string value to appropriate type based on key"""
@@ -652,7 +832,6 @@ class SDHostCLI:
             # Parse list values (comma-separated)
             if value.startswith('[') and value.endswith(']'):
                 # JSON-style list
-                import json
                 try:
                     return json.loads(value)
                 except json.JSONDecodeError:
@@ -667,7 +846,19 @@ class SDHostCLI:
     
     def show_help(self):
         """Show detailed help information"""
-        help_text = f"""
+        print(_HELP_TEXT)
+
+    def _colored_status(self, status: str) -> str:
+        """Return colored status string"""
+        wrapped = _STATUS_WRAPPED.get(status)
+        if wrapped is None:
+            wrapped = f"{Colors.WHITE}{status}{Colors.END}"
+        return wrapped
+
+
+# Help text only interpolates Colors constants, so render it once at
+# import instead of rebuilding the f-string on every `sdh --help`
+_HELP_TEXT = f"""
 {Colors.BOLD}{Colors.CYAN}SD-Host CLI Tool (sdh){Colors.END}
 
 {Colors.BOLD}DESCRIPTION:{Colors.END}
@@ -740,124 +931,192 @@ class SDHostCLI:
 {Colors.BOLD}ENVIRONMENT VARIABLES:{Colors.END}
     SDH_DEPOT            Depot directory path
         """
-        print(help_text)
-    
-    def _colored_status(self, status: str) -> str:
-        """Return colored status string"""
-        colors = {
-            "ready": Colors.GREEN,
-            "downloading": Colors.YELLOW,
-            "error": Colors.RED,
-            "pending": Colors.BLUE
-        }
-        color = colors.get(status, Colors.WHITE)
-        return f"{color}{status}{Colors.END}"
+
+# Action sets as module-level tuples: shared by the parser builders
+# (no per-build list allocation) and readable from the help text
+SERVICE_ACTIONS = ("status", "start", "stop", "restart")
+MODELS_ACTIONS = ("list", "status")
+IMAGES_ACTIONS = ("list",)
+TASKS_ACTIONS = ("list", "status")
+
+def _build_service_parser(parser):
+    parser.add_argument("action", choices=SERVICE_ACTIONS,
+                        help="Service action")
+
+def _build_models_parser(parser):
+    parser.add_argument("action", choices=MODELS_ACTIONS,
+                        help="Models action")
+
+def _build_images_parser(parser):
+    parser.add_argument("action", choices=IMAGES_ACTIONS,
+                        help="Images action")
+
+def _build_tasks_parser(parser):
+    parser.add_argument("action", choices=TASKS_ACTIONS,
+                        help="Tasks action")
+
+def _build_config_parser(parser):
+    config_subparsers = parser.add_subparsers(dest="config_action", help="Config actions")
+
+    config_subparsers.add_parser("show", help="Show all configuration values")
+
+    config_get_parser = config_subparsers.add_parser("get", help="Get specific configuration value")
+    config_get_parser.add_argument("key", help="Configuration key (e.g., server.port)")
+
+    config_set_parser = config_subparsers.add_parser("set", help="Set configuration value")
+    config_set_parser.add_argument("key", help="Configuration key (e.g., server.port)")
+    config_set_parser.add_argument("value", help="Configuration value")
+
+    config_subparsers.add_parser("path", help="Show configuration file path")
+
+    config_subparsers.add_parser("init", help="Initialize configuration file")
+
+# Lazily-built subcommand parsers: only the chosen command pays its
+# add_argument cost instead of every invocation building all of them
+_SUBPARSER_BUILDERS = {
+    "service": _build_service_parser,
+    "models": _build_models_parser,
+    "images": _build_images_parser,
+    "tasks": _build_tasks_parser,
+    "config": _build_config_parser,
+}
+
+# Sorted once for the root parser's choices= instead of per invocation
+_COMMANDS = tuple(sorted(_SUBPARSER_BUILDERS))
+
+# Static (command, action) dispatch table instead of an if/elif chain
+_HANDLERS = {
+    ("service", "status"): lambda cli, args: cli.show_service_status(),
+    ("service", "start"): lambda cli, args: cli.start_service(),
+    ("service", "stop"): lambda cli, args: cli.stop_service(),
+    ("service", "restart"): lambda cli, args: cli.restart_service(),
+    ("models", "list"): lambda cli, args: cli.show_models_list(),
+    ("models", "status"): lambda cli, args: cli.show_models_status(),
+    ("images", "list"): lambda cli, args: cli.show_images_list(),
+    ("tasks", "list"): lambda cli, args: cli.show_tasks_list(),
+    ("tasks", "status"): lambda cli, args: cli.show_tasks_status(),
+    ("config", "show"): lambda cli, args: cli.show_config(),
+    ("config", "get"): lambda cli, args: cli.get_config_value(args.key),
+    ("config", "set"): lambda cli, args: cli.set_config_value(args.key, args.value),
+    ("config", "path"): lambda cli, args: cli.show_config_path(),
+    ("config", "init"): lambda cli, args: cli.init_config(),
+}
+
+@functools.lru_cache(maxsize=1)
+def _common_parser() -> argparse.ArgumentParser:
+    """Global flags shared by the root and per-command parsers.
+
+    Built once per process and attached via parents= so each parser
+    reuses the same action objects instead of re-running add_argument.
+    SUPPRESS keeps a phase-2 re-parse from clobbering values phase 1
+    already put into the namespace.
+    """
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--depot", "-d", type=str, default=argparse.SUPPRESS,
+                        help="Depot directory path (overrides SDH_DEPOT env var)")
+    common.add_argument("--config", "-c", type=str, default=argparse.SUPPRESS,
+                        help="Configuration file path")
+    return common
+
+def _fast_dispatch(argv) -> bool:
+    """Hand-rolled fast path for the common command shapes.
+
+    Recognizes `sdh [--depot X] [--config Y] <command> <action> [args]`
+    exactly and dispatches without constructing any argparse parser.
+    Anything else — help, version, unknown tokens, wrong arity — returns
+    False and falls back to the full argparse path, which owns all error
+    reporting.
+    """
+    depot = config = None
+    i, n = 0, len(argv)
+    while i < n:
+        tok = argv[i]
+        if tok in ("--depot", "-d"):
+            if i + 1 >= n:
+                return False
+            depot = argv[i + 1]
+            i += 2
+        elif tok in ("--config", "-c"):
+            if i + 1 >= n:
+                return False
+            config = argv[i + 1]
+            i += 2
+        else:
+            break
+    rest = argv[i:]
+    if len(rest) < 2 or any(tok.startswith("-") for tok in rest):
+        return False
+    command, action, extra = rest[0], rest[1], rest[2:]
+    if (command, action) not in _HANDLERS:
+        return False
+    # Positional arity must match what the real parsers would accept
+    if command == "config" and action == "get":
+        if len(extra) != 1:
+            return False
+        args = argparse.Namespace(key=extra[0])
+    elif command == "config" and action == "set":
+        if len(extra) != 2:
+            return False
+        args = argparse.Namespace(key=extra[0], value=extra[1])
+    elif extra:
+        return False
+    else:
+        args = argparse.Namespace()
+
+    cli = SDHostCLI(depot_dir=depot, config_path=config)
+    _HANDLERS[(command, action)](cli, args)
+    return True
 
 def main():
     """Main CLI entry point"""
+    if _fast_dispatch(sys.argv[1:]):
+        return
+
+    # Phase 1: global flags plus the command name only. Help is handled
+    # manually so `sdh <command> --help` reaches the command's parser.
     parser = argparse.ArgumentParser(
         description="SD-Host CLI Tool - Manage SD-Host service and query status",
-        prog="sdh"
+        prog="sdh",
+        parents=[_common_parser()],
+        add_help=False
     )
-    
+
+    parser.add_argument("-h", "--help", action="store_true", help="Show this help message and exit")
     parser.add_argument("--version", action="version", version="sdh 1.0.0")
-    parser.add_argument("--depot", "-d", type=str, help="Depot directory path (overrides SDH_DEPOT env var)")
-    parser.add_argument("--config", "-c", type=str, help="Configuration file path")
-    
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Service management
-    service_parser = subparsers.add_parser("service", help="Service management")
-    service_parser.add_argument("action", choices=["status", "start", "stop", "restart"], 
-                               help="Service action")
-    
-    # Models management
-    models_parser = subparsers.add_parser("models", help="Models management")
-    models_parser.add_argument("action", choices=["list", "status"], 
-                              help="Models action")
-    
-    # Images management
-    images_parser = subparsers.add_parser("images", help="Images management")
-    images_parser.add_argument("action", choices=["list"], 
-                              help="Images action")
-    
-    # Tasks management
-    tasks_parser = subparsers.add_parser("tasks", help="Tasks management")
-    tasks_parser.add_argument("action", choices=["list", "status"], 
-                             help="Tasks action")
-    
-    # Config management
-    config_parser = subparsers.add_parser("config", help="Configuration management")
-    config_subparsers = config_parser.add_subparsers(dest="config_action", help="Config actions")
-    
-    # Config show
-    config_show_parser = config_subparsers.add_parser("show", help="Show all configuration values")
-    
-    # Config get
-    config_get_parser = config_subparsers.add_parser("get", help="Get specific configuration value")
-    config_get_parser.add_argument("key", help="Configuration key (e.g., server.port)")
-    
-    # Config set
-    config_set_parser = config_subparsers.add_parser("set", help="Set configuration value")
-    config_set_parser.add_argument("key", help="Configuration key (e.g., server.port)")
-    config_set_parser.add_argument("value", help="Configuration value")
-    
-    # Config path
-    config_path_parser = config_subparsers.add_parser("path", help="Show configuration file path")
-    
-    # Config init
-    config_init_parser = config_subparsers.add_parser("init", help="Initialize configuration file")
-    
-    args = parser.parse_args()
-    
+    parser.add_argument("command", nargs="?", choices=_COMMANDS,
+                        help="Available commands")
+
+    args, remainder = parser.parse_known_args()
+
     # If no command provided, show help
     if not args.command:
         parser.print_help()
         return
-    
-    cli = SDHostCLI(depot_dir=args.depot, config_path=args.config)
-    
-    # Handle commands
-    if args.command == "service":
-        if args.action == "status":
-            cli.show_service_status()
-        elif args.action == "start":
-            cli.start_service()
-        elif args.action == "stop":
-            cli.stop_service()
-        elif args.action == "restart":
-            cli.restart_service()
-    
-    elif args.command == "models":
-        if args.action == "list":
-            cli.show_models_list()
-        elif args.action == "status":
-            cli.show_models_status()
-    
-    elif args.command == "images":
-        if args.action == "list":
-            cli.show_images_list()
-    
-    elif args.command == "tasks":
-        if args.action == "list":
-            cli.show_tasks_list()
-        elif args.action == "status":
-            cli.show_tasks_status()
-    
-    elif args.command == "config":
-        if args.config_action == "show":
-            cli.show_config()
-        elif args.config_action == "get":
-            cli.get_config_value(args.key)
-        elif args.config_action == "set":
-            cli.set_config_value(args.key, args.value)
-        elif args.config_action == "path":
-            cli.show_config_path()
-        elif args.config_action == "init":
-            cli.init_config()
-        else:
-            # If no subcommand, show help for config
-            config_parser.print_help()
+
+    if args.help:
+        # Forward --help to the command parser built below
+        remainder = ["--help"] + remainder
+
+    # Phase 2: construct just the chosen command's parser and fold its
+    # arguments into the same namespace
+    command_parser = argparse.ArgumentParser(
+        prog=f"sdh {args.command}",
+        description=f"SD-Host {args.command} management",
+        parents=[_common_parser()]
+    )
+    _SUBPARSER_BUILDERS[args.command](command_parser)
+    command_parser.parse_args(remainder, namespace=args)
+
+    # Constant-time dispatch through the handler table
+    action = args.config_action if args.command == "config" else args.action
+    if action is None:
+        # config invoked without a subcommand
+        command_parser.print_help()
+        return
+
+    cli = SDHostCLI(depot_dir=getattr(args, "depot", None),
+                    config_path=getattr(args, "config", None))
+    _HANDLERS[(args.command, action)](cli, args)
 
 if __name__ == "__main__":
     main()
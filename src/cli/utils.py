@@ -3,46 +3,96 @@ CLI utilities and common functions
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+import functools
 import os
 import sys
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-
 # Add src to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from core.config import load_config, get_config_file_path
+if TYPE_CHECKING:
+    from rich.table import Table
+
+# rich and core.config (pydantic, yaml) are deferred to first use so
+# `sdh --help` and `sdh --version` never pay their import cost
+
+class _LazyConsole:
+    """Stand-in for the global console.
+
+    Builds the real rich Console (importing rich in the process) on
+    first attribute access; until then, importing this module stays
+    cheap. Every subcommand module does `from ..utils import console`
+    at import time, so a plain Console() here would defeat lazy loading.
+    """
+
+    _real = None
+
+    def __getattr__(self, name):
+        real = _LazyConsole._real
+        if real is None:
+            from rich.console import Console
 
-# Global console instance
-console = Console()
+            real = _LazyConsole._real = Console()
+        return getattr(real, name)
+
+# Global console instance (materialized on first use)
+console = _LazyConsole()
+
+@functools.lru_cache(maxsize=1)
+def _project_dir() -> Path:
+    """Project root (two levels above src/cli), resolved once per process.
+
+    Path.absolute() hits getcwd plus normpath, so repeated CLIState
+    constructions shouldn't redo it.
+    """
+    return Path(__file__).parent.parent.parent.absolute()
 
 class CLIState:
     """Shared CLI state and utilities"""
     
-    def __init__(self, depot_dir: Optional[str] = None, config_path: Optional[str] = None):
+    def __init__(self, depot_dir: Optional[str] = None, config_path: Optional[str] = None,
+                 readonly: bool = False):
+        from core.config import load_config, load_config_readonly
+
         # CLI is in src/cli/ subdirectory, so project root is two levels up
-        self.project_dir = Path(__file__).parent.parent.parent.absolute()
-        self.python_exe = self.project_dir / "venv" / "Scripts" / "python.exe"
-        self.main_script = self.project_dir / "src" / "api" / "main.py"
-        
-        # Load configuration with depot override
-        self.settings = load_config(config_path, depot_dir)
-        
-        # Set up paths based on configuration
-        self.pid_file = Path(self.settings.depot_dir) / ".sdh.pid"
-        self.log_file = Path(self.settings.logging.file)
+        self.project_dir = _project_dir()
+
+        # Load configuration with depot override; the loader also makes
+        # sure the depot directory tree (including the log dir) exists.
+        # Read-only commands share the cached instance and skip the
+        # defensive copy that mutating commands need.
+        loader = load_config_readonly if readonly else load_config
+        self.settings = loader(config_path, depot_dir)
+
+        # psutil.Process objects cached by PID so repeated status checks
+        # don't re-parse process info from scratch
+        self._proc_cache = {}
+
+    # The derived paths below are cached properties: commands that never
+    # touch the service (config show/get/path) allocate none of them
+
+    @functools.cached_property
+    def python_exe(self) -> Path:
+        return self.project_dir / "venv" / "Scripts" / "python.exe"
+
+    @functools.cached_property
+    def main_script(self) -> Path:
+        return self.project_dir / "src" / "api" / "main.py"
+
+    @functools.cached_property
+    def pid_file(self) -> Path:
+        return Path(self.settings.depot_dir) / ".sdh.pid"
+
+    @functools.cached_property
+    def log_file(self) -> Path:
+        return Path(self.settings.logging.file)
+
+    @functools.cached_property
+    def api_base(self) -> str:
         # Use localhost for CLI connections if host is 0.0.0.0
         host = self.settings.host if self.settings.host != "0.0.0.0" else "localhost"
-        self.api_base = f"http://{host}:{self.settings.port}"
-        
-        # Ensure directories exist
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        Path(self.settings.depot_dir).mkdir(parents=True, exist_ok=True)
+        return f"http://{host}:{self.settings.port}"
 
 def success(message: str):
     """Print success message"""
@@ -62,20 +112,29 @@ def info(message: str):
 
 def header(text: str):
     """Print styled header"""
+    from rich.panel import Panel
+    from rich.text import Text
+    from rich import box
+
     console.print(Panel(Text(text, style="bold cyan"), box=box.DOUBLE))
 
-def create_table(title: str) -> Table:
+def create_table(title: str) -> "Table":
     """Create a styled table"""
+    from rich.table import Table
+    from rich import box
+
     table = Table(title=title, box=box.ROUNDED, show_header=True, header_style="bold cyan")
     return table
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # bit_length picks the unit directly (1024 = 2^10 per step), so one
+    # shift and one division replace the divide-and-loop — this runs per
+    # row when rendering model/image tables
+    unit_idx = max(0, min(5, (int(bytes_value).bit_length() - 1) // 10))
+    return f"{bytes_value / (1 << (unit_idx * 10)):.1f} {_BYTE_UNITS[unit_idx]}"
 
 def format_boolean(value: bool) -> str:
     """Format boolean with color"""
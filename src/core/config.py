@@ -2,15 +2,36 @@
 Configuration management for SD-Host
 """
 
+import copy
+import dataclasses
+import functools
 import os
+import pickle
 import yaml
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
 import platform
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C loader, much faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-class ServerConfig(BaseModel):
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+# The config tree is plain dataclasses rather than pydantic models: the
+# CLI only reads a handful of fields per invocation, and skipping the
+# pydantic import plus per-field validator dispatch shaves a large slice
+# off startup. YAML already delivers typed scalars, so construction is
+# plain attribute assignment.
+
+@dataclass
+class ServerConfig:
     """Server configuration"""
     host: str = "0.0.0.0"
     port: int = 8000
@@ -19,10 +40,9 @@ class ServerConfig(BaseModel):
     reload: bool = False
 
 
-class StableDiffusionConfig(BaseModel):
+@dataclass
+class StableDiffusionConfig:
     """Stable Diffusion configuration"""
-    model_config = {"protected_namespaces": ()}
-    
     model_name: str = "runwayml/stable-diffusion-v1-5"
     model_path: Optional[str] = None
     device: str = "auto"
@@ -40,9 +60,10 @@ class StableDiffusionConfig(BaseModel):
     nsfw_filter: bool = True
 
 
-class StorageConfig(BaseModel):
+@dataclass
+class StorageConfig:
     """Storage configuration"""
-    depot_dir: str = Field(default_factory=lambda: get_default_depot_dir())
+    depot_dir: str = field(default_factory=lambda: get_default_depot_dir())
     models_dir: Optional[str] = None
     output_dir: Optional[str] = None
     data_dir: Optional[str] = None
@@ -52,31 +73,35 @@ class StorageConfig(BaseModel):
     image_retention_days: int = 7
 
 
-class APIConfig(BaseModel):
+@dataclass
+class APIConfig:
     """API configuration"""
     rate_limit_requests: int = 10
     rate_limit_window: int = 60
     timeout: int = 300
     max_request_size: int = 10485760  # 10MB
-    cors_origins: list = ["*"]
-    cors_methods: list = ["GET", "POST", "PUT", "DELETE"]
-    cors_headers: list = ["*"]
+    cors_origins: List[str] = field(default_factory=lambda: ["*"])
+    cors_methods: List[str] = field(default_factory=lambda: ["GET", "POST", "PUT", "DELETE"])
+    cors_headers: List[str] = field(default_factory=lambda: ["*"])
     api_prefix: str = "/api"
 
 
-class CivitaiConfig(BaseModel):
+@dataclass
+class CivitaiConfig:
     """Civitai configuration"""
     api_key: Optional[str] = "c166827d7f1cda8cd073aeb2796552ae"
     base_url: str = "https://civitai.com/api/v1"
 
 
-class ProxyConfig(BaseModel):
+@dataclass
+class ProxyConfig:
     """Proxy configuration"""
     http_proxy: Optional[str] = None
     https_proxy: Optional[str] = None
 
 
-class LoggingConfig(BaseModel):
+@dataclass
+class LoggingConfig:
     """Logging configuration"""
     level: str = "INFO"
     format: str = "structured"
@@ -85,7 +110,8 @@ class LoggingConfig(BaseModel):
     backup_count: int = 5
 
 
-class SecurityConfig(BaseModel):
+@dataclass
+class SecurityConfig:
     """Security configuration"""
     api_key_enabled: bool = False
     api_key: str = ""
@@ -94,7 +120,8 @@ class SecurityConfig(BaseModel):
     ssl_key_file: str = ""
 
 
-class MonitoringConfig(BaseModel):
+@dataclass
+class MonitoringConfig:
     """Monitoring configuration"""
     health_check_enabled: bool = True
     metrics_enabled: bool = False
@@ -102,53 +129,93 @@ class MonitoringConfig(BaseModel):
     track_performance: bool = True
 
 
-class FileConfig(BaseModel):
+@dataclass
+class FileConfig:
     """File handling configuration"""
     max_file_size: int = 10 * 1024 * 1024 * 1024  # 10GB
-    allowed_extensions: list = [".safetensors", ".ckpt", ".pt", ".bin", ".pth"]
-
-
-class Settings(BaseModel):
+    allowed_extensions: List[str] = field(
+        default_factory=lambda: [".safetensors", ".ckpt", ".pt", ".bin", ".pth"])
+
+
+def _build(cls, data: Dict[str, Any]):
+    """Construct a config dataclass from a parsed mapping.
+
+    Unknown keys are ignored (pydantic's old behaviour) and nested
+    sections given as dicts are recursively built.
+    """
+    kwargs = {}
+    for f in dataclasses.fields(cls):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if isinstance(value, dict) and dataclasses.is_dataclass(f.type):
+            value = _build(f.type, value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
+def _to_dict(obj) -> Dict[str, Any]:
+    """Serialize a config dataclass to a plain dict, dropping None values
+    (mirrors the old model_dump(exclude_none=True))"""
+    result = {}
+    for f in dataclasses.fields(obj):
+        value = getattr(obj, f.name)
+        if dataclasses.is_dataclass(value):
+            value = _to_dict(value)
+        if value is not None:
+            result[f.name] = value
+    return result
+
+
+@dataclass
+class Settings:
     """Application settings"""
-    
+
     # App metadata
     app_name: str = "SD-Host"
     app_version: str = "0.1.0"
-    
+
     # Configuration sections
-    server: ServerConfig = Field(default_factory=ServerConfig)
-    stable_diffusion: StableDiffusionConfig = Field(default_factory=StableDiffusionConfig)
-    storage: StorageConfig = Field(default_factory=StorageConfig)
-    api: APIConfig = Field(default_factory=APIConfig)
-    civitai: CivitaiConfig = Field(default_factory=CivitaiConfig)
-    proxy: ProxyConfig = Field(default_factory=ProxyConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
-    file: FileConfig = Field(default_factory=FileConfig)
-    
-    def __init__(self, **data):
-        super().__init__(**data)
+    server: ServerConfig = field(default_factory=ServerConfig)
+    stable_diffusion: StableDiffusionConfig = field(default_factory=StableDiffusionConfig)
+    storage: StorageConfig = field(default_factory=StorageConfig)
+    api: APIConfig = field(default_factory=APIConfig)
+    civitai: CivitaiConfig = field(default_factory=CivitaiConfig)
+    proxy: ProxyConfig = field(default_factory=ProxyConfig)
+    logging: LoggingConfig = field(default_factory=LoggingConfig)
+    security: SecurityConfig = field(default_factory=SecurityConfig)
+    monitoring: MonitoringConfig = field(default_factory=MonitoringConfig)
+    file: FileConfig = field(default_factory=FileConfig)
+
+    def __post_init__(self):
+        # Sections may arrive as plain dicts straight from YAML
+        for f in dataclasses.fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, dict) and dataclasses.is_dataclass(f.type):
+                setattr(self, f.name, _build(f.type, value))
         self._resolve_paths()
-    
+
     def _resolve_paths(self):
         """Resolve and set up directory paths"""
-        depot_dir = Path(self.storage.depot_dir)
-        
+        # Plain string joins: each pathlib `/` allocates and re-parses a
+        # new Path, and this runs on every settings construction
+        depot_dir = self.storage.depot_dir
+
         # Always recalculate depot subdirectories based on current depot_dir
-        self.storage.models_dir = str(depot_dir / "models")
-        self.storage.output_dir = str(depot_dir / "output")
-        self.storage.data_dir = str(depot_dir / "data")
-        
+        self.storage.models_dir = os.path.join(depot_dir, "models")
+        self.storage.output_dir = os.path.join(depot_dir, "output")
+        self.storage.data_dir = os.path.join(depot_dir, "data")
+
         # Set up database URL
         self.storage.database_url = f"sqlite+aiosqlite:///{self.storage.data_dir}/sd_host.db"
-        
+
         # Set up logging file
-        self.logging.file = str(depot_dir / "logs" / "sd_host.log")
-        
+        self.logging.file = os.path.join(depot_dir, "logs", "sd_host.log")
+
         # Set up stable diffusion model path if not set
         if not self.stable_diffusion.model_path:
-            self.stable_diffusion.model_path = str(Path(self.storage.models_dir) / self.stable_diffusion.model_name)
+            self.stable_diffusion.model_path = os.path.join(
+                self.storage.models_dir, self.stable_diffusion.model_name)
     
     @property
     def depot_dir(self) -> str:
@@ -196,42 +263,123 @@ class Settings(BaseModel):
         return self.api.cors_origins
 
 
+@functools.lru_cache(maxsize=1)
+def _home_dir() -> Path:
+    """User home directory, resolved once per process.
+
+    Path.home() goes through expanduser and environment lookups; the
+    answer never changes while we run.
+    """
+    return Path.home()
+
+
 def get_default_depot_dir() -> str:
     """Get default depot directory"""
-    # Check environment variable first
+    # Check environment variable first (not cacheable: load_config
+    # updates SDH_DEPOT when a depot override is given)
     depot_dir = os.environ.get("SDH_DEPOT")
     if depot_dir:
         return depot_dir
-    
+
     # Default to user home directory
-    home_dir = Path.home()
-    return str(home_dir / "sd-host" / "depot")
+    return str(_home_dir() / "sd-host" / "depot")
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_file_path() -> Path:
     """Get configuration file path"""
-    home_dir = Path.home()
-    return home_dir / "sd-host" / "config.yml"
+    return _home_dir() / "sd-host" / "config.yml"
 
 
-def load_config(config_path: Optional[str] = None, depot_dir: Optional[str] = None) -> Settings:
-    """Load configuration from file"""
-    
+# Parsed-YAML cache keyed by (path, mtime_ns, size). Repeated loads in
+# one process skip the parse entirely; a pickle sidecar next to the
+# config file covers fresh processes, since unpickling a small dict is
+# far cheaper than parsing YAML
+_YAML_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _load_pickle_cache(cache_file: Path, key: tuple) -> Optional[Dict[str, Any]]:
+    """Read the on-disk parse cache; any failure just means a re-parse"""
+    try:
+        with open(cache_file, 'rb') as f:
+            payload = pickle.load(f)
+        data = payload.get(key)
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+def _store_pickle_cache(cache_file: Path, key: tuple, data: Dict[str, Any]):
+    """Write the on-disk parse cache (best effort).
+
+    Written to a temp file and moved into place with os.replace so a
+    concurrent reader never sees a half-written cache; a partial pickle
+    would otherwise fail to load and force a re-parse on every run.
+    """
+    tmp_file = cache_file.with_suffix('.pkl.tmp')
+    try:
+        with open(tmp_file, 'wb') as f:
+            pickle.dump({key: data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+
+
+def _read_config_data(config_file: Path) -> Dict[str, Any]:
+    """Parse the YAML config file with (mtime, size)-keyed caching.
+
+    Returns a deep copy so callers can mutate the result (the depot
+    override does) without poisoning the cache.
+    """
+    st = os.stat(config_file)
+    key = (str(config_file), st.st_mtime_ns, st.st_size)
+
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        cache_file = config_file.with_name(".config.cache.pkl")
+        data = _load_pickle_cache(cache_file, key)
+        if data is None:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                data = yaml.load(f, Loader=_YamlLoader) or {}
+            _store_pickle_cache(cache_file, key, data)
+        _YAML_CACHE[key] = data
+    return copy.deepcopy(data)
+
+
+def _freeze(value):
+    """Recursively convert parsed config data into a hashable cache key"""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Validated Settings instances keyed by frozen config content + depot
+_SETTINGS_CACHE: Dict[tuple, Settings] = {}
+
+
+def _load_cached_settings(config_path: Optional[str] = None,
+                          depot_dir: Optional[str] = None) -> Settings:
+    """Resolve the (shared) Settings instance for the given inputs"""
+
     # Override depot directory if provided (takes precedence)
     if depot_dir:
         os.environ["SDH_DEPOT"] = depot_dir
-    
+
     if config_path:
         config_file = Path(config_path)
     else:
         config_file = get_config_file_path()
-    
+
     # Load configuration from file if it exists
     config_data = {}
     if config_file.exists():
         try:
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
+            config_data = _read_config_data(config_file)
         except Exception as e:
             print(f"Warning: Could not load config file {config_file}: {e}")
             print("Using default configuration")
@@ -241,28 +389,73 @@ def load_config(config_path: Optional[str] = None, depot_dir: Optional[str] = No
         if "storage" not in config_data:
             config_data["storage"] = {}
         config_data["storage"]["depot_dir"] = depot_dir
-    
-    # Create settings instance
-    settings = Settings(**config_data)
-    
+
+    # Memoize Settings construction: validating dozens of fields across
+    # the nested models dwarfs a cache lookup plus a validation-free
+    # copy. SDH_DEPOT joins the key because path resolution reads it.
+    cache_key = (_freeze(config_data), os.environ.get("SDH_DEPOT"))
+    cached = _SETTINGS_CACHE.get(cache_key)
+    if cached is None:
+        cached = _SETTINGS_CACHE[cache_key] = _build(Settings, config_data)
+    return cached
+
+
+def load_config(config_path: Optional[str] = None, depot_dir: Optional[str] = None) -> Settings:
+    """Load configuration from file"""
+    # Deep copy keeps the cached instance pristine when callers mutate
+    # sub-sections in place (config set does)
+    settings = copy.deepcopy(_load_cached_settings(config_path, depot_dir))
+
     # Ensure directories exist
     ensure_directories(settings)
-    
+
     return settings
 
 
+def load_config_readonly(config_path: Optional[str] = None,
+                         depot_dir: Optional[str] = None) -> Settings:
+    """Load configuration for read-only use.
+
+    Returns the shared cached instance without the defensive copy, so
+    commands that only read settings skip the deepcopy. Callers must
+    treat the result as immutable.
+    """
+    settings = _load_cached_settings(config_path, depot_dir)
+    ensure_directories(settings)
+    return settings
+
+
+# Depots whose directory tree has been verified in this process; skips
+# the stat/mkdir round on every subsequent load_config call
+_DEPOT_INITIALIZED: set = set()
+
+
 def ensure_directories(settings: Settings):
     """Ensure all required directories exist"""
-    directories = [
-        settings.depot_dir,
+    if settings.depot_dir in _DEPOT_INITIALIZED:
+        return
+
+    # Minimal leaf set: makedirs(parents=True) on any leaf under the
+    # depot creates the depot root too, so it only needs its own entry
+    # when every leaf has been redirected elsewhere
+    directories = {
         settings.models_dir,
         settings.output_dir,
         settings.data_dir,
-        str(Path(settings.logging.file).parent),
-    ]
-    
+        os.path.dirname(settings.logging.file),
+    }
+    if not any(d.startswith(settings.depot_dir + os.sep) for d in directories):
+        directories.add(settings.depot_dir)
+
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        # A single stat on the existing-directory path beats the chain
+        # of per-component stats mkdir(parents=True) performs
+        try:
+            os.stat(directory)
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+
+    _DEPOT_INITIALIZED.add(settings.depot_dir)
 
 
 def save_config(settings: Settings, config_path: Optional[str] = None):
@@ -276,11 +469,21 @@ def save_config(settings: Settings, config_path: Optional[str] = None):
     config_file.parent.mkdir(parents=True, exist_ok=True)
     
     # Convert settings to dict for YAML output
-    config_data = settings.model_dump(exclude_none=True)
-    
+    config_data = _to_dict(settings)
+
     try:
+        # Serialize with the C dumper, then skip the write (and the
+        # resulting mtime bump / cache invalidation) if nothing changed
+        serialized = yaml.dump(config_data, Dumper=_YamlDumper,
+                               default_flow_style=False, allow_unicode=True, indent=2)
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                if f.read() == serialized:
+                    return
+        except OSError:
+            pass
         with open(config_file, 'w', encoding='utf-8') as f:
-            yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True, indent=2)
+            f.write(serialized)
     except Exception as e:
         raise RuntimeError(f"Could not save config to {config_file}: {e}")
 
@@ -2,38 +2,55 @@
 Database configuration and session management
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from typing import AsyncGenerator
-import aiosqlite
+from typing import TYPE_CHECKING, AsyncGenerator
 import os
 from pathlib import Path
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
-class Base(DeclarativeBase):
-    """Base class for all database models"""
-    pass
+# SQLAlchemy and aiosqlite are imported on first use (PEP 562 module
+# __getattr__ below) so importing core.database costs almost nothing for
+# consumers that never touch the DB — notably the CLI.
+
+_base = None
+
+
+def _get_base():
+    """Get the declarative base, creating it (and importing SQLAlchemy)
+    on first use"""
+    global _base
+    if _base is None:
+        from sqlalchemy.orm import DeclarativeBase
+
+        class Base(DeclarativeBase):
+            """Base class for all database models"""
+            pass
+
+        _base = Base
+    return _base
 
 
 class DatabaseManager:
     """Database manager for handling SQLite connections"""
-    
+
     def __init__(self, database_url: str = None):
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
         if database_url is None:
             # Use configuration to get database URL
             import sys
-            import os
             sys.path.insert(0, os.path.dirname(__file__))
             from config import get_settings
             settings = get_settings()
             database_url = settings.database_url
-            
+
             # Ensure database directory exists
             if database_url.startswith("sqlite"):
                 # Extract path from SQLite URL
                 db_path = database_url.replace("sqlite+aiosqlite:///", "")
                 Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        
+
         self.database_url = database_url
         self.engine = create_async_engine(
             database_url,
@@ -44,28 +61,55 @@ class DatabaseManager:
             class_=AsyncSession,
             expire_on_commit=False,
         )
-    
+
     async def create_tables(self):
         """Create all tables in the database"""
         async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-    
+            await conn.run_sync(_get_base().metadata.create_all)
+
     async def close(self):
         """Close database connections"""
         await self.engine.dispose()
-    
-    def get_session(self) -> AsyncSession:
+
+    def get_session(self) -> "AsyncSession":
         """Get a new database session"""
         return self.async_session()
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, constructed on first use so that
+# importing this module doesn't spin up an engine
+_db_manager = None
+
+
+def get_db_manager() -> DatabaseManager:
+    """Get the shared DatabaseManager, creating it on first use"""
+    global _db_manager
+    if _db_manager is None:
+        _db_manager = DatabaseManager()
+    return _db_manager
+
+
+def __getattr__(name):
+    # Lazy module attributes: legacy `from core.database import
+    # db_manager` (or Base/AsyncSession) triggers the heavy imports only
+    # when actually referenced
+    if name == "db_manager":
+        return get_db_manager()
+    if name == "Base":
+        base = _get_base()
+        globals()["Base"] = base
+        return base
+    if name == "AsyncSession":
+        from sqlalchemy.ext.asyncio import AsyncSession
+
+        globals()["AsyncSession"] = AsyncSession
+        return AsyncSession
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db() -> AsyncGenerator["AsyncSession", None]:
     """FastAPI dependency for getting database session"""
-    async with db_manager.get_session() as session:
+    async with get_db_manager().get_session() as session:
         try:
             yield session
         finally:
@@ -2,7 +2,6 @@
 Database Operations - 处理下载任务的数据库CRUD操作
 """
 
-import json
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy import select, update, delete
@@ -33,11 +32,12 @@ class DownloadTaskDatabase:
             total_size=download_info.get("size"),
             civitai_model_id=model_info.get("modelId"),
             civitai_version_id=model_info.get("id"),
-            download_metadata=json.dumps({
+            # OrjsonText serializes at bind time; pass the dict directly
+            download_metadata={
                 "filename": download_info["filename"],
                 "expected_hash": download_info.get("hash"),
                 "model_info": model_info
-            })
+            }
         )
         
         self.session.add(db_task)
@@ -4,7 +4,7 @@ Model service layer for business logic
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_, desc, asc
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from typing import List, Optional, Dict, Any, Tuple
 import json
 import hashlib
@@ -90,10 +90,13 @@ class ModelService:
         offset = (pagination.number - 1) * pagination.size
         query = query.offset(offset).limit(pagination.size)
         
-        # Load relationships - always load for now to ensure CLI displays work correctly
+        # Load relationships - always load for now to ensure CLI displays work correctly.
+        # raiseload('*') turns any relationship access we didn't plan for
+        # into an error instead of a silent per-row query (N+1 guard)
         query = query.options(
             selectinload(Model.tags).selectinload(ModelTag.tag),
-            selectinload(Model.cover_image)
+            selectinload(Model.cover_image),
+            raiseload("*")
         )
         
         # Execute query
@@ -137,7 +140,8 @@ class ModelService:
         
         query = select(Model).where(Model.hash == resolved_hash).options(
             selectinload(Model.tags).selectinload(ModelTag.tag),
-            selectinload(Model.cover_image)
+            selectinload(Model.cover_image),
+            raiseload("*")
         )
         
         result = await self.session.execute(query)